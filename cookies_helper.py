@@ -27,42 +27,78 @@ import sys
 import json
 import re
 import time
-import subprocess
 import shutil
+import fnmatch
+import heapq
 import logging
+import http.cookiejar
+import importlib
+import functools
 from pathlib import Path
-from datetime import datetime
 from logging.handlers import RotatingFileHandler
+from concurrent.futures import ThreadPoolExecutor
 
-# Required for API testing
-try:
-    import requests
-except ImportError:
-    print("⚠️  Warning: 'requests' not installed. API testing disabled.")
-    print("   Install: pip install requests")
-    requests = None
-
-try:
-    import google.generativeai as genai
-except ImportError:
-    print("⚠️  Warning: 'google-generativeai' not installed. Gemini testing disabled.")
-    print("   Install: pip install google-generativeai")
-    genai = None
+# ============================================================================
+# LAZY IMPORTS
+# ============================================================================
+
+# Optional modules used only by the API tests (requests). Imported on
+# first use so cookie conversion and the menus start without paying for them.
+_MODS = {}
+
+def _lazy(name):
+    """
+    Import module on first call and memoize it
+    
+    Raises:
+        ImportError: If the module is not installed
+    """
+    module = _MODS.get(name)
+    if module is None:
+        module = importlib.import_module(name)
+        _MODS[name] = module
+    return module
+
+@functools.lru_cache(maxsize=None)
+def _get_session():
+    """
+    Shared requests.Session for the API tests (keep-alive + pooled TLS)
+    
+    Raises:
+        ImportError: If requests is not installed
+    """
+    requests = _lazy('requests')
+    adapters = _lazy('requests.adapters')
+    session = requests.Session()
+    adapter = adapters.HTTPAdapter(pool_connections=4, pool_maxsize=8)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
 
 # ============================================================================
 # LOGGING SETUP
 # ============================================================================
 
+# Importing the module (e.g. for the cookie converters) sets up nothing and
+# leaves the host's root logger alone: the NullHandler on this module's logger
+# only keeps its records from reaching logging's last-resort stderr handler.
+# The CLI entry point installs the real handlers via setup_logging().
+logger = logging.getLogger(__name__)
+logger.addHandler(logging.NullHandler())
+
+@functools.lru_cache(maxsize=1)
 def setup_logging():
-    """Setup logging with file rotation"""
+    """Setup logging with file rotation (runs once per process)"""
     log_file = Path("cookies_helper.log")
     
-    # Create file handler with rotation (5MB max, 3 backups)
+    # Create file handler with rotation (5MB max, 3 backups);
+    # delay=True opens the log file on the first record, not here
     file_handler = RotatingFileHandler(
         log_file,
         maxBytes=5*1024*1024,
         backupCount=3,
-        encoding='utf-8'
+        encoding='utf-8',
+        delay=True
     )
     file_handler.setLevel(logging.DEBUG)
     
@@ -78,27 +114,34 @@ def setup_logging():
     file_handler.setFormatter(formatter)
     console_handler.setFormatter(formatter)
     
-    # Configure root logger
-    logger = logging.getLogger()
+    # Configure the module logger (replacing the import-time NullHandler)
+    for handler in logger.handlers[:]:
+        if isinstance(handler, logging.NullHandler):
+            logger.removeHandler(handler)
     logger.setLevel(logging.INFO)
     logger.addHandler(file_handler)
     logger.addHandler(console_handler)
     
-    logging.info("="*50)
-    logging.info("Cookies Helper v1.1 started")
-    logging.info("="*50)
-
-# Call setup at module load
-setup_logging()
+    logger.info("="*50)
+    logger.info("Cookies Helper v1.1 started")
+    logger.info("="*50)
 
 # ============================================================================
 # CONSTANTS & CONFIGURATION
 # ============================================================================
 
-# File paths (absolute)
-REPO_ROOT = Path(__file__).resolve().parent
+# File paths (absolute; abspath avoids resolve()'s per-component lstat walk,
+# every path below is derived from these without resolving again)
+_HERE = os.path.abspath(__file__)
+REPO_ROOT = Path(os.path.dirname(_HERE))
 SECRETS_DIR = REPO_ROOT / "secrets"
 
+# Frequently used secrets files (built once, reused by every check/save)
+ENV_PATH = SECRETS_DIR / ".env"
+API_KEYS_PATH = SECRETS_DIR / "api_keys.txt"
+YOUTUBE_KEYS_PATH = SECRETS_DIR / "youtube" / "api_keys.txt"
+PEXELS_KEY_PATH = SECRETS_DIR / "pexels_key.txt"
+
 # Fallback locations for cookies
 COOKIES_PATHS = [
     SECRETS_DIR / "cookies.txt",
@@ -111,38 +154,55 @@ COOKIES_PATHS = [
 # API key file paths by type (FIXED v2.3.1 - 2025-10-31)
 API_KEYS_PATHS = {
     "gemini": [
-        SECRETS_DIR / "api_keys.txt",          # Priority 1: Main file (3 working keys ✅)
+        API_KEYS_PATH,                         # Priority 1: Main file (3 working keys ✅)
         SECRETS_DIR / "gemini" / "api_keys.txt",  # Priority 2: Subfolder
         SECRETS_DIR / "api_key.txt",           # Priority 3: Alternative
         SECRETS_DIR / "gemini" / "api_key.txt",   # Priority 4: Subfolder alt
-        SECRETS_DIR / ".env"                   # Priority 5: Env (some keys fail)
+        ENV_PATH                               # Priority 5: Env (some keys fail)
     ],
     "youtube": [
-        SECRETS_DIR / "youtube" / "api_keys.txt",  # Priority 1: CORRECT location (3 keys ✅)
-        SECRETS_DIR / "api_keys.txt",          # Priority 2: Shared file
-        SECRETS_DIR / ".env"                   # Priority 3: Env fallback
+        YOUTUBE_KEYS_PATH,                     # Priority 1: CORRECT location (3 keys ✅)
+        API_KEYS_PATH,                         # Priority 2: Shared file
+        ENV_PATH                               # Priority 3: Env fallback
     ],
     "pexels": [
-        SECRETS_DIR / "pexels_key.txt",        # Priority 1: Dedicated file
+        PEXELS_KEY_PATH,                       # Priority 1: Dedicated file
         SECRETS_DIR / "pexels" / "api_key.txt",   # Priority 2: Subfolder
-        SECRETS_DIR / ".env",                  # Priority 3: Env
-        SECRETS_DIR / "api_keys.txt"           # Priority 4: Shared
+        ENV_PATH,                              # Priority 3: Env
+        API_KEYS_PATH                          # Priority 4: Shared
     ]
 }
 
 # Validation patterns
 PATTERNS = {
     "google_api": re.compile(r'^AIzaSy[A-Za-z0-9_-]{33}$'),
-    "pexels_api": re.compile(r'^[A-Za-z0-9]{50,60}$')
+    "pexels_api": re.compile(r'^[A-Za-z0-9]{50,60}$'),
+    # Cookie domains kept from JSON exports (YouTube/Google + Amazon)
+    "cookie_domain": re.compile(r'(?:youtube|google|amazon)\.com'),
+    # .env variable names (update_env_file)
+    "env_var_name": re.compile(r'^[A-Z_][A-Z0-9_]*$'),
+    # Format sniffing: anchored at the start, so only the head is scanned
+    "html_head": re.compile(r'\s*<(?:html|!doctype)', re.IGNORECASE),
+    "json_head": re.compile(r'\s*[\[{]')
 }
 
 # API endpoints for testing
 ENDPOINTS = {
+    "gemini": "https://generativelanguage.googleapis.com/v1/models",
     "youtube": "https://www.googleapis.com/youtube/v3/videos",
     "pexels": "https://api.pexels.com/videos/search",
-    "test_video": "https://www.youtube.com/watch?v=dQw4w9WgXcQ"
+    "subscriptions": "https://www.youtube.com/feed/subscriptions"
 }
 
+# A signed-in YouTube session needs one of these Google auth cookies
+AUTH_COOKIE_NAMES = frozenset({"SAPISID", "__Secure-3PSID"})
+
+# ytcfg flag on YouTube pages served to a signed-in session
+_LOGGED_IN_MARKER = '"LOGGED_IN":true'
+
+# Translation table that drops CR/LF from pasted keys and env values
+_STRIP_NEWLINES = str.maketrans('', '', '\r\n')
+
 # ============================================================================
 # UTILITY FUNCTIONS
 # ============================================================================
@@ -150,7 +210,7 @@ ENDPOINTS = {
 def ensure_secrets_dir():
     """Create secrets/ directory if missing"""
     SECRETS_DIR.mkdir(exist_ok=True)
-    logging.debug(f"Ensured secrets directory exists: {SECRETS_DIR}")
+    logger.debug("Ensured secrets directory exists: %s", SECRETS_DIR)
 
 def read_multiline_input():
     """
@@ -169,7 +229,7 @@ def read_multiline_input():
         pass
     
     content = "\n".join(lines)
-    logging.debug(f"Read multiline input: {len(content)} bytes")
+    logger.debug("Read multiline input: %s bytes", len(content))
     return content
 
 def mask_key(key, show_chars=10):
@@ -181,6 +241,28 @@ def mask_key(key, show_chars=10):
         return key
     return f"{key[:show_chars]}... ({len(key)} chars)"
 
+# One row of a '📊 Summary' block, rendered with a % mapping
+SUMMARY_ROW = "    %(icon)s %(label)s: %(count)d"
+
+def status_summary(rows):
+    """
+    Build the '📊 Summary' block of a check_*_status function
+    
+    Args:
+        rows (list): (icon, label, count) tuples
+        
+    Returns:
+        list: Lines ready for print_block()
+    """
+    return ["\n  📊 Summary:"] + [
+        SUMMARY_ROW % {"icon": icon, "label": label, "count": count}
+        for icon, label, count in rows
+    ]
+
+def print_block(lines):
+    """Print a block of lines with a single stdout write"""
+    sys.stdout.write("\n".join(lines) + "\n")
+
 # ============================================================================
 # COOKIE FORMAT DETECTION & CONVERSION
 # ============================================================================
@@ -190,24 +272,22 @@ def detect_cookies_format(content):
     Detect cookies format: json, netscape, html, or unknown
     Returns: str ('json' | 'netscape' | 'html' | 'unknown')
     """
-    content = content.strip()
-    
-    # Check HTML (reject)
-    if '<html>' in content.lower() or '<!doctype' in content.lower():
-        logging.warning("Detected HTML format (rejected)")
+    # Check HTML (reject) - markers are always at the start
+    if PATTERNS['html_head'].match(content):
+        logger.warning("Detected HTML format (rejected)")
         return 'html'
     
     # Check JSON
-    if content.startswith('[') or content.startswith('{'):
-        logging.info("Detected JSON format")
+    if PATTERNS['json_head'].match(content):
+        logger.info("Detected JSON format")
         return 'json'
     
     # Check Netscape
     if '# Netscape HTTP Cookie File' in content:
-        logging.info("Detected Netscape format")
+        logger.info("Detected Netscape format")
         return 'netscape'
     
-    logging.warning("Unknown cookies format")
+    logger.warning("Unknown cookies format")
     return 'unknown'
 
 def json_to_netscape(json_content):
@@ -227,52 +307,40 @@ def json_to_netscape(json_content):
         if not isinstance(cookies, list):
             cookies = [cookies]
         
-        logging.info(f"Parsing {len(cookies)} cookies from JSON")
+        logger.info("Parsing %s cookies from JSON", len(cookies))
         
-        # Start with Netscape header
+        # Convert YouTube/Google/Amazon cookies (all needed domains) to
+        # TAB-separated Netscape lines; other domains are skipped
+        cookie_domain = PATTERNS['cookie_domain']
         lines = [
-            "# Netscape HTTP Cookie File",
-            "# This is a generated file! Do not edit.",
-            ""
+            f"{domain}\t{'FALSE' if c.get('hostOnly', False) else 'TRUE'}\t{c.get('path', '/')}\t"
+            f"{'TRUE' if c.get('secure', False) else 'FALSE'}\t{int(c.get('expirationDate', 0))}\t"
+            f"{c.get('name', '')}\t{c.get('value', '')}"
+            for c in cookies
+            if cookie_domain.search(domain := c.get('domain', ''))
         ]
-        
-        kept_count = 0
-        
-        # Convert each cookie
-        for cookie in cookies:
-            domain = cookie.get('domain', '')
-            
-            # Accept YouTube/Google/Amazon cookies (all needed domains)
-            valid_domains = ['youtube.com', 'google.com', 'amazon.com']
-            if not any(d in domain for d in valid_domains):
-                continue  # Skip other domains
-            
-            # Extract fields with defaults
-            flag = "TRUE" if not cookie.get('hostOnly', False) else "FALSE"
-            path = cookie.get('path', '/')
-            secure = "TRUE" if cookie.get('secure', False) else "FALSE"
-            expiration = int(cookie.get('expirationDate', 0))
-            name = cookie.get('name', '')
-            value = cookie.get('value', '')
-            
-            # Build Netscape line (TAB-separated)
-            line = f"{domain}\t{flag}\t{path}\t{secure}\t{expiration}\t{name}\t{value}"
-            lines.append(line)
-            kept_count += 1
+        kept_count = len(lines)
         
         if kept_count == 0:
-            logging.error("No valid cookies found in JSON (need YouTube/Google/Amazon)")
+            logger.error("No valid cookies found in JSON (need YouTube/Google/Amazon)")
             return None, "No valid cookies found (need YouTube, Google, or Amazon cookies)"
         
+        # Prepend Netscape header
+        lines[:0] = [
+            "# Netscape HTTP Cookie File",
+            "# This is a generated file! Do not edit.",
+            ""
+        ]
+        
         netscape_content = "\n".join(lines)
-        logging.info(f"Converted {kept_count} cookies to Netscape format")
+        logger.info("Converted %s cookies to Netscape format", kept_count)
         return netscape_content, None
         
     except json.JSONDecodeError as e:
-        logging.error(f"JSON decode error: {e}")
+        logger.error("JSON decode error: %s", e)
         return None, f"Invalid JSON: {str(e)}"
     except Exception as e:
-        logging.error(f"Conversion error: {e}")
+        logger.error("Conversion error: %s", e)
         return None, f"Conversion failed: {str(e)}"
 
 def validate_netscape_format(content):
@@ -284,38 +352,37 @@ def validate_netscape_format(content):
     """
     # Size check
     if len(content) < 50:
-        logging.warning("Cookies file too small")
+        logger.warning("Cookies file too small")
         return False, "File too small (< 50 bytes)"
     
     # Header check
     if "# Netscape HTTP Cookie File" not in content:
-        logging.warning("Missing Netscape header")
+        logger.warning("Missing Netscape header")
         return False, "Missing Netscape header"
     
-    # YouTube/Amazon cookies check
-    has_youtube = False
-    has_amazon = False
-    
+    # Single pass: count cookie lines and detect YouTube/Amazon domains
+    has_youtube = has_amazon = False
+    cookie_line_count = 0
     for line in content.splitlines():
-        if '.youtube.com' in line or '.google.com' in line:
+        # Domains are matched on every line (#HttpOnly_ cookies included)
+        if not has_youtube and ('.youtube.com' in line or '.google.com' in line):
             has_youtube = True
-        if '.amazon.com' in line:
+        if not has_amazon and '.amazon.com' in line:
             has_amazon = True
-        if has_youtube or has_amazon:
-            break  # Found at least one valid domain
+        if line.strip() and not line.startswith('#'):
+            cookie_line_count += 1
     
     if not has_youtube and not has_amazon:
-        logging.warning("No YouTube/Google/Amazon cookies found")
+        logger.warning("No YouTube/Google/Amazon cookies found")
         return False, "No YouTube/Google/Amazon cookies found (need at least one)"
     
     # Line count check
-    cookie_lines = [l for l in content.splitlines() 
-                    if l.strip() and not l.startswith('#')]
-    if len(cookie_lines) < 3:  # Relaxed from 5 to 3
-        logging.warning(f"Too few cookies: {len(cookie_lines)}")
+    if cookie_line_count < 3:  # Relaxed from 5 to 3
+        logger.warning("Too few cookies: %s", cookie_line_count)
         return False, "Too few cookies (< 3)"
     
-    logging.info(f"Validated Netscape format: {len(cookie_lines)} cookies (YouTube={has_youtube}, Amazon={has_amazon})")
+    logger.info("Validated Netscape format: %s cookies (YouTube=%s, Amazon=%s)",
+                cookie_line_count, has_youtube, has_amazon)
     return True, None
 
 # ============================================================================
@@ -406,7 +473,7 @@ def validate_api_key_format(key, api_type):
         if not PATTERNS['google_api'].match(key):
             return False, "Invalid characters (use alphanumeric + - _)"
         
-        logging.info(f"Valid {api_type} key format")
+        logger.info("Valid %s key format", api_type)
         return True, None
     
     elif api_type == 'pexels':
@@ -420,7 +487,7 @@ def validate_api_key_format(key, api_type):
         if not PATTERNS['pexels_api'].match(key):
             return False, "Invalid format"
         
-        logging.info("Valid Pexels key format")
+        logger.info("Valid Pexels key format")
         return True, None
     
     return False, f"Unknown API type: {api_type}"
@@ -429,9 +496,16 @@ def validate_api_key_format(key, api_type):
 # API TESTING FUNCTIONS
 # ============================================================================
 
-def test_cookies_with_ytdlp(cookies_path):
+def test_cookies_with_http(cookies_path):
     """
-    Test cookies by fetching a YouTube video with yt-dlp
+    Test cookies with a signed-in YouTube page request
+    
+    Loads the Netscape file into a MozillaCookieJar and requests the
+    subscriptions feed without following redirects. The session counts as
+    live only if the jar holds a Google auth cookie and the page comes back
+    200 with "LOGGED_IN":true in its ytcfg; a redirect (to sign-in) means
+    the cookies expired. Runs in process, so there is no yt-dlp/Python
+    startup per test.
     
     Args:
         cookies_path (Path): Path to cookies file
@@ -439,100 +513,122 @@ def test_cookies_with_ytdlp(cookies_path):
     Returns:
         tuple: (success, message)
     """
-    logging.info(f"Testing cookies: {cookies_path}")
+    logger.info("Testing cookies: %s", cookies_path)
     
-    cmd = [
-        "yt-dlp",
-        "--cookies", str(cookies_path),
-        "--skip-download",
-        "--print", "title",
-        ENDPOINTS['test_video']
-    ]
+    try:
+        requests = _lazy('requests')
+        adapter = _get_session().get_adapter(ENDPOINTS['subscriptions'])
+    except ImportError:
+        logger.warning("Requests module not available")
+        return False, "Module not installed"
+    
+    jar = http.cookiejar.MozillaCookieJar(str(cookies_path))
+    try:
+        jar.load(ignore_discard=True, ignore_expires=True)
+    except (http.cookiejar.LoadError, OSError) as e:
+        logger.error("Cookies load error: %s", e)
+        return False, "Invalid cookies file"
+    
+    # Expiry 0 marks a session cookie in exports; the jar would treat it as expired
+    has_auth_cookie = False
+    for cookie in jar:
+        if not cookie.expires:
+            cookie.expires = None
+        if cookie.name in AUTH_COOKIE_NAMES:
+            has_auth_cookie = True
+    
+    if not has_auth_cookie:
+        logger.warning("Cookies test failed: %s (no auth cookies)", cookies_path)
+        return False, "No sign-in cookies (SAPISID / __Secure-3PSID)"
+    
+    # Private session so Set-Cookie replies never leak into the next test;
+    # the shared adapter keeps the pooled keep-alive connection.
+    session = requests.Session()
+    session.mount("https://", adapter)
+    session.cookies = jar
     
     try:
-        result = subprocess.run(
-            cmd,
-            capture_output=True,
-            text=True,
-            timeout=30,
-            check=True
+        response = session.get(
+            ENDPOINTS['subscriptions'],
+            timeout=10,
+            allow_redirects=False
         )
         
-        if result.returncode == 0 and result.stdout.strip():
-            logging.info(f"Cookies test passed: {cookies_path}")
-            return True, "Successfully fetched video title"
-        
-        logging.warning(f"Cookies test failed: {cookies_path}")
-        return False, "Failed to fetch video data"
+        if response.status_code == 200:
+            # Logged-out and consent pages can also come back 200
+            if _LOGGED_IN_MARKER in response.text:
+                logger.info("Cookies test passed: %s", cookies_path)
+                return True, "Signed-in session active"
+            logger.warning("Cookies test failed: %s (not signed in)", cookies_path)
+            return False, "Not signed in: Cookies expired"
         
-    except subprocess.TimeoutExpired:
-        logging.error(f"Cookies test timeout: {cookies_path}")
-        return False, "Timeout (network issue?)"
-    
-    except subprocess.CalledProcessError as e:
-        error = e.stderr or e.stdout or ""
-        logging.error(f"Cookies test error: {error[:100]}")
+        logger.warning("Cookies test failed: %s (HTTP %s)", cookies_path, response.status_code)
         
-        if "403" in error or "Forbidden" in error:
+        if response.is_redirect:
+            return False, "Redirected to sign-in: Cookies expired"
+        elif response.status_code == 403:
             return False, "HTTP 403: Cookies expired"
-        elif "401" in error:
+        elif response.status_code == 401:
             return False, "HTTP 401: Cookies invalid"
-        return False, f"yt-dlp error: {error[:50]}"
-    
-    except FileNotFoundError:
-        logging.error("yt-dlp not found")
-        return False, "yt-dlp not installed"
+        return False, f"HTTP {response.status_code}"
+        
+    except requests.Timeout:
+        logger.error("Cookies test timeout: %s", cookies_path)
+        return False, "Timeout (network issue?)"
     
     except Exception as e:
-        logging.error(f"Cookies test exception: {e}")
+        logger.error("Cookies test exception: %s", e)
         return False, f"Test failed: {str(e)}"
 
 def test_gemini_api(api_key):
     """
-    Test Gemini API key with real API call
+    Test Gemini API key with a models.list call
+    
+    Lists models instead of generating content: same key check, ~100ms,
+    no token generation and no quota used.
     
     Returns:
         tuple: (success, message, details_dict)
     """
-    if not genai:
-        logging.warning("Gemini module not available")
+    try:
+        _lazy('requests')
+    except ImportError:
+        logger.warning("Requests module not available")
         return False, "Module not installed", {}
     
-    logging.info(f"Testing Gemini API: {mask_key(api_key)}")
+    logger.info("Testing Gemini API: %s", mask_key(api_key))
     
     try:
-        genai.configure(api_key=api_key)  # type: ignore
-        # Use stable production model (same as pipeline)
-        model = genai.GenerativeModel('gemini-2.5-flash')  # type: ignore
-        
         start = time.time()
-        response = model.generate_content("Reply: 'API key works'")
+        response = _get_session().get(ENDPOINTS['gemini'], params={"key": api_key}, timeout=10)
         elapsed = time.time() - start
         
-        if response and response.text:
-            logging.info(f"Gemini API test passed: {elapsed:.1f}s")
+        if response.status_code == 200:
+            # Same production model as the pipeline; confirm the key can see it
+            names = {m.get("name", "").rsplit("/", 1)[-1] for m in response.json().get("models", [])}
+            model = "gemini-2.5-flash" if "gemini-2.5-flash" in names else "gemini-2.5-flash (not listed)"
+            logger.info("Gemini API test passed: %.1fs", elapsed)
             return True, "API key works", {
-                "model": "gemini-2.5-flash",
+                "model": model,
                 "response_time": round(elapsed, 1)
             }
         
-        logging.warning("Gemini API empty response")
-        return False, "Empty response", {}
-        
-    except Exception as e:
-        error = str(e)
-        logging.error(f"Gemini API test failed: {e}")
+        error = response.text
+        logger.error("Gemini API test failed: HTTP %s", response.status_code)
         
-        # Better error detection
-        if "quota" in error.lower() or "429" in error:
+        if response.status_code == 429 or "RESOURCE_EXHAUSTED" in error:
             return False, "QUOTA_EXCEEDED", {}
-        elif "invalid" in error.lower() or "401" in error:
+        elif "API_KEY_INVALID" in error or response.status_code == 401:
             return False, "API_KEY_INVALID", {}
-        elif "403" in error:
+        elif response.status_code == 403:
             # Check if it's "API not enabled" error
             if "has not been used" in error or "not enabled" in error.lower():
                 return False, "API_NOT_ENABLED", {}
             return False, "PERMISSION_DENIED", {}
+        return False, f"HTTP {response.status_code}", {}
+        
+    except Exception as e:
+        logger.error("Gemini API test failed: %s", e)
         return False, f"Error: {str(e)[:50]}", {}
 
 def test_youtube_api(api_key):
@@ -542,11 +638,13 @@ def test_youtube_api(api_key):
     Returns:
         tuple: (success, message, quota_info)
     """
-    if not requests:
-        logging.warning("Requests module not available")
+    try:
+        requests = _lazy('requests')
+    except ImportError:
+        logger.warning("Requests module not available")
         return False, "Module not installed", ""
     
-    logging.info(f"Testing YouTube API: {mask_key(api_key)}")
+    logger.info("Testing YouTube API: %s", mask_key(api_key))
     
     try:
         params = {
@@ -555,31 +653,31 @@ def test_youtube_api(api_key):
             "key": api_key
         }
         
-        response = requests.get(ENDPOINTS['youtube'], params=params, timeout=10)
+        response = _get_session().get(ENDPOINTS['youtube'], params=params, timeout=10)
         
         if response.status_code == 200:
-            logging.info("YouTube API test passed")
+            logger.info("YouTube API test passed")
             return True, "API key works", "Quota info unavailable"
         elif response.status_code == 403:
             error = response.json().get("error", {})
             reason = error.get("errors", [{}])[0].get("reason", "")
             if reason == "quotaExceeded":
-                logging.warning("YouTube API quota exceeded")
+                logger.warning("YouTube API quota exceeded")
                 return False, "QUOTA_EXCEEDED", "10,000 limit"
-            logging.error(f"YouTube API forbidden: {reason}")
+            logger.error("YouTube API forbidden: %s", reason)
             return False, f"Forbidden: {reason}", ""
         elif response.status_code == 400:
-            logging.error("YouTube API invalid key format")
+            logger.error("YouTube API invalid key format")
             return False, "Invalid API key format", ""
         else:
-            logging.error(f"YouTube API HTTP {response.status_code}")
+            logger.error("YouTube API HTTP %s", response.status_code)
             return False, f"HTTP {response.status_code}", ""
             
     except requests.Timeout:
-        logging.error("YouTube API timeout")
+        logger.error("YouTube API timeout")
         return False, "Timeout", ""
     except Exception as e:
-        logging.error(f"YouTube API test exception: {e}")
+        logger.error("YouTube API test exception: %s", e)
         return False, f"Error: {str(e)[:50]}", ""
 
 def test_pexels_api(api_key):
@@ -589,17 +687,19 @@ def test_pexels_api(api_key):
     Returns:
         tuple: (success, message, rate_limit_info)
     """
-    if not requests:
-        logging.warning("Requests module not available")
+    try:
+        requests = _lazy('requests')
+    except ImportError:
+        logger.warning("Requests module not available")
         return False, "Module not installed", ""
     
-    logging.info(f"Testing Pexels API: {mask_key(api_key)}")
+    logger.info("Testing Pexels API: %s", mask_key(api_key))
     
     try:
         headers = {"Authorization": api_key}
         params = {"query": "nature", "per_page": 1}
         
-        response = requests.get(
+        response = _get_session().get(
             ENDPOINTS['pexels'],
             headers=headers,
             params=params,
@@ -609,29 +709,95 @@ def test_pexels_api(api_key):
         if response.status_code == 200:
             limit = response.headers.get("X-Ratelimit-Limit", "200")
             remaining = response.headers.get("X-Ratelimit-Remaining", "?")
-            logging.info(f"Pexels API test passed: {remaining}/{limit}")
+            logger.info("Pexels API test passed: %s/%s", remaining, limit)
             return True, "API key works", f"{remaining}/{limit}"
         elif response.status_code == 401:
-            logging.error("Pexels API unauthorized")
+            logger.error("Pexels API unauthorized")
             return False, "Unauthorized", ""
         elif response.status_code == 429:
-            logging.warning("Pexels API rate limited")
+            logger.warning("Pexels API rate limited")
             return False, "RATE_LIMITED", "200/hour"
         else:
-            logging.error(f"Pexels API HTTP {response.status_code}")
+            logger.error("Pexels API HTTP %s", response.status_code)
             return False, f"HTTP {response.status_code}", ""
             
     except requests.Timeout:
-        logging.error("Pexels API timeout")
+        logger.error("Pexels API timeout")
         return False, "Timeout", ""
     except Exception as e:
-        logging.error(f"Pexels API test exception: {e}")
+        logger.error("Pexels API test exception: %s", e)
         return False, f"Error: {str(e)[:50]}", ""
 
 # ============================================================================
 # FILE OPERATIONS
 # ============================================================================
 
+def list_file_names(directory):
+    """
+    Names of regular files in a directory (one scandir, no per-file stat)
+    Returns: set of str (empty if the directory is missing)
+    """
+    try:
+        with os.scandir(directory) as entries:
+            return {entry.name for entry in entries if entry.is_file()}
+    except FileNotFoundError:
+        return set()
+
+def existing_cookies_paths():
+    """
+    COOKIES_PATHS entries that exist, from one listing per directory
+    Returns: set of Path
+    """
+    listings = {d: list_file_names(d) for d in {p.parent for p in COOKIES_PATHS}}
+    return {p for p in COOKIES_PATHS if p.name in listings[p.parent]}
+
+def load_api_keys(path):
+    """
+    Read an api_keys.txt file once: skip comments, strip inline comments
+    
+    Returns:
+        list: Keys in file order, or None if the file does not exist
+    """
+    try:
+        data = path.read_bytes()
+    except FileNotFoundError:
+        return None
+    keys = []
+    for line in data.splitlines():
+        # Full-line and inline comments in one cut (partition: no list per line)
+        key = line.partition(b'#')[0].strip()
+        if key:
+            # Decode only the surviving key, not comments and blank lines
+            keys.append(key.decode('utf-8'))
+    return keys
+
+@functools.lru_cache(maxsize=8)
+def _parse_env_cached(path, mtime_ns):
+    """Parse a .env file into {name: value} (first definition wins)"""
+    env = {}
+    for line in path.read_bytes().splitlines():
+        line = line.strip()
+        if not line or line.startswith(b'#'):
+            continue
+        name, _, value = line.partition(b'=')
+        name = name.strip().decode('utf-8')
+        if name not in env:
+            env[name] = value.strip().decode('utf-8')
+    return env
+
+def parse_env_file(path):
+    """
+    Parse .env into a dict, cached until the file changes (mtime_ns)
+    
+    Returns:
+        dict: {name: value}, empty if the file does not exist (read-only)
+    """
+    try:
+        mtime_ns = os.stat(path).st_mtime_ns
+    except FileNotFoundError:
+        return {}
+    return _parse_env_cached(path, mtime_ns)
+
 def find_empty_cookies_slot():
     """
     Find first empty cookies slot
@@ -640,76 +806,117 @@ def find_empty_cookies_slot():
         Path or None
     """
     for path in COOKIES_PATHS[:4]:  # Only writable slots
-        if not path.exists() or path.stat().st_size < 50:
-            logging.debug(f"Found empty slot: {path}")
+        # One stat per slot: missing and near-empty both count as empty
+        try:
+            size = path.stat().st_size
+        except FileNotFoundError:
+            size = 0
+        if size < 50:
+            logger.debug("Found empty slot: %s", path)
             return path
-    logging.debug("No empty slots found")
+    logger.debug("No empty slots found")
     return None
 
 def clean_old_backups(file_path, keep=5):
     """Keep only last N backup files"""
     try:
         pattern = f"{file_path.stem}.*.bak"
-        backups = sorted(
-            file_path.parent.glob(pattern),
-            key=lambda p: p.stat().st_mtime,
-            reverse=True
-        )
+        with os.scandir(file_path.parent) as entries:
+            backups = [(entry.stat().st_mtime, entry.path) for entry in entries
+                       if fnmatch.fnmatch(entry.name, pattern)]
         
-        # Delete old backups
-        for backup in backups[keep:]:
-            backup.unlink()
-            logging.debug(f"Deleted old backup: {backup}")
+        # Delete old backups (only the oldest len-keep need ordering)
+        for _, backup in heapq.nsmallest(len(backups) - keep, backups):
+            os.unlink(backup)
+            logger.debug("Deleted old backup: %s", backup)
     except Exception as e:
-        logging.warning(f"Failed to clean backups: {e}")
+        logger.warning("Failed to clean backups: %s", e)
 
-def save_to_file(path, content):
+def link_backup(path, backup_path):
+    """
+    Keep the current version of path as backup_path without copying data
+    
+    Hard-links the existing inode (path is replaced by rename afterwards,
+    so the link keeps the old content); copies where links are unsupported.
+    """
+    try:
+        os.link(path, backup_path)
+    except OSError:
+        shutil.copy2(path, backup_path)
+
+def commit_staged_file(staged_path, path):
+    """
+    Atomically move a fully written staged file over path
+    
+    Keeps the permission bits of the file being replaced.
+    
+    Returns:
+        tuple: (success, error_message)
+    """
+    try:
+        try:
+            os.chmod(staged_path, os.stat(path).st_mode & 0o7777)
+        except FileNotFoundError:
+            pass
+        os.replace(staged_path, path)
+        logger.info("Saved file: %s", path)
+        return True, None
+    except PermissionError:
+        logger.error("Permission denied: %s", path)
+        return False, "Permission denied"
+    except OSError as e:
+        logger.error("OS error saving %s: %s", path, e)
+        return False, f"OS error: {e.strerror}"
+    finally:
+        if staged_path.exists():
+            staged_path.unlink()
+
+def save_to_file(path, content, *, backup=True):
     """
     Save content to file with backup and error handling
     
+    The new content is staged in a .new file (created 0o600, fsynced) and
+    renamed over path, so path always holds either the old or the new
+    version and keeps its permission bits.
+    
+    Args:
+        path (Path): Target file
+        content (str | bytes): New file content (str is UTF-8 encoded)
+        backup (bool): Keep the previous version as a .bak (hard link,
+            not a copy). Pass False when the caller already has one.
+    
     Returns:
         tuple: (success, error_message)
     """
-    backup_path = None
+    staged_path = path.with_suffix('.new')
     
     try:
+        # Encode once (bytes pass straight through), before touching any file
+        data = content if isinstance(content, bytes) else content.encode('utf-8')
+        
         # Create parent directory
         path.parent.mkdir(parents=True, exist_ok=True)
         
-        # Backup existing file
-        if path.exists() and path.stat().st_size > 0:
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            backup_path = path.with_suffix(f'.{timestamp}.bak')
-            shutil.copy2(path, backup_path)
-            logging.info(f"Created backup: {backup_path}")
-        
-        # Write new content
-        path.write_text(content, encoding='utf-8')
-        logging.info(f"Saved file: {path} ({len(content)} bytes)")
-        
-        # Verify written content
-        if path.read_text(encoding='utf-8') != content:
-            raise IOError("Content verification failed")
-        
-        # Clean old backups (keep last 5)
-        clean_old_backups(path, keep=5)
-        
-        return True, None
+        # Owner-only from creation; commit_staged_file applies the old mode.
+        # fsync makes write errors (e.g. disk full) raise here
+        staged_path.unlink(missing_ok=True)
+        flags = os.O_WRONLY | os.O_CREAT | os.O_EXCL | getattr(os, 'O_BINARY', 0)
+        with open(os.open(staged_path, flags, 0o600), 'wb', buffering=0) as f:
+            f.write(data)
+            os.fsync(f.fileno())
         
+    except UnicodeEncodeError:
+        logger.error("Unicode error: %s", path)
+        return False, "Invalid characters in content"
+    
     except PermissionError:
-        logging.error(f"Permission denied: {path}")
-        # Rollback
-        if backup_path and backup_path.exists():
-            shutil.move(str(backup_path), str(path))
-            logging.info("Rolled back to backup")
+        logger.error("Permission denied: %s", path)
+        staged_path.unlink(missing_ok=True)
         return False, "Permission denied"
     
     except OSError as e:
-        logging.error(f"OS error saving {path}: {e}")
-        # Rollback
-        if backup_path and backup_path.exists():
-            shutil.move(str(backup_path), str(path))
-            logging.info("Rolled back to backup")
+        logger.error("OS error saving %s: %s", path, e)
+        staged_path.unlink(missing_ok=True)
         
         if e.errno == 28:  # Disk full
             return False, "Disk full - free up space"
@@ -717,54 +924,68 @@ def save_to_file(path, content):
             return False, "Filename too long"
         return False, f"OS error: {e.strerror}"
     
-    except UnicodeEncodeError:
-        logging.error(f"Unicode error: {path}")
-        if backup_path and backup_path.exists():
-            shutil.move(str(backup_path), str(path))
-        return False, "Invalid characters in content"
-    
-    except Exception as e:
-        logging.error(f"Unexpected error saving {path}: {e}")
-        # Rollback
-        if backup_path and backup_path.exists():
-            shutil.move(str(backup_path), str(path))
-            logging.info("Rolled back to backup")
-        return False, f"Write failed: {str(e)}"
+    # Backup existing file: link the current inode (no copy)
+    if backup:
+        try:
+            size = os.stat(path).st_size
+        except FileNotFoundError:
+            size = 0
+        if size > 0:
+            timestamp = time.strftime("%Y%m%d_%H%M%S")
+            backup_path = path.with_suffix(f'.{timestamp}.bak')
+            try:
+                link_backup(path, backup_path)
+                logger.info("Created backup: %s", backup_path)
+            except OSError as e:
+                logger.error("Failed to backup %s: %s", path, e)
+                staged_path.unlink(missing_ok=True)
+                return False, f"Backup failed: {e.strerror}"
+    
+    success, error = commit_staged_file(staged_path, path)
+    if success:
+        # Clean old backups (keep last 5)
+        clean_old_backups(path, keep=5)
+    return success, error
 
 def append_to_api_keys(path, key):
     """
     Append API key to file (deduplicates)
     
+    Append-only: existing lines (comments included) are left untouched, so
+    no rewrite or backup of the whole file is needed.
+    
     Returns:
         tuple: (success, message)
     """
-    # Read existing keys (clean comments and inline comments)
-    existing = []
-    if path.exists():
-        for line in path.read_text(encoding='utf-8').splitlines():
-            line = line.strip()
-            # Skip empty lines and full-line comments
-            if not line or line.startswith('#'):
-                continue
-            # Remove inline comments (split on #)
-            clean_key = line.split('#')[0].strip()
-            if clean_key:
-                existing.append(clean_key)
+    # Read existing keys (clean comments and inline comments) into a set
+    existing = set(load_api_keys(path) or ())
     
     # Deduplicate - check if key already exists
     if key in existing:
-        logging.warning(f"Key already exists in {path}")
+        logger.warning("Key already exists in %s", path)
         return False, "⚠️  Key already exists in file"
     
     # Append new key
-    existing.append(key)
-    content = "\n".join(existing) + "\n"
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path, 'a+b') as f:
+            # Start on a fresh line if the file lacks a trailing newline
+            size = f.seek(0, os.SEEK_END)
+            prefix = b''
+            if size:
+                f.seek(size - 1)
+                if f.read(1) != b'\n':
+                    prefix = b'\n'
+            f.write(prefix + key.encode('utf-8') + b'\n')
+    except PermissionError:
+        logger.error("Permission denied: %s", path)
+        return False, "Permission denied"
+    except OSError as e:
+        logger.error("OS error appending to %s: %s", path, e)
+        return False, f"OS error: {e.strerror}"
     
-    success, error = save_to_file(path, content)
-    if success:
-        logging.info(f"Appended key to {path}")
-        return True, f"✅ Saved to {path.name}"
-    return False, error
+    logger.info("Appended key to %s", path)
+    return True, f"✅ Saved to {path.name}"
 
 def update_env_file(var_name, value):
     """
@@ -778,34 +999,42 @@ def update_env_file(var_name, value):
     value = value.strip()
     
     # Remove dangerous characters
-    var_name = var_name.replace('\n', '').replace('\r', '')
-    value = value.replace('\n', '').replace('\r', '')
+    var_name = var_name.translate(_STRIP_NEWLINES)
+    value = value.translate(_STRIP_NEWLINES)
     
     # Validate var name
-    if not re.match(r'^[A-Z_][A-Z0-9_]*$', var_name):
-        logging.error(f"Invalid env var name: {var_name}")
+    if not PATTERNS['env_var_name'].match(var_name):
+        logger.error("Invalid env var name: %s", var_name)
         return False, f"Invalid variable name: {var_name}"
     
-    env_path = SECRETS_DIR / ".env"
-    
-    # Read existing
-    if env_path.exists():
-        content = env_path.read_text()
-    else:
-        content = ""
+    env_path = ENV_PATH
     
-    # Update or append
-    pattern = rf'^{var_name}=.*$'
-    if re.search(pattern, content, re.MULTILINE):
+    # Read existing (bytes: only the new line is encoded, nothing decoded)
+    try:
+        content = env_path.read_bytes()
+    except FileNotFoundError:
+        content = b""
+    
+    # Update or append (line-wise prefix scan, no per-call regex)
+    prefix = f'{var_name}='.encode('utf-8')
+    new_line = prefix + value.encode('utf-8')
+    lines = content.split(b'\n')
+    found = False
+    for idx, line in enumerate(lines):
+        if line.startswith(prefix):
+            lines[idx] = new_line
+            found = True
+    
+    if found:
         # Update existing
-        content = re.sub(pattern, f'{var_name}={value}', content, flags=re.MULTILINE)
-        logging.info(f"Updated env var: {var_name}")
+        content = b'\n'.join(lines)
+        logger.info("Updated env var: %s", var_name)
     else:
         # Append new
-        if content and not content.endswith('\n'):
-            content += '\n'
-        content += f'{var_name}={value}\n'
-        logging.info(f"Added env var: {var_name}")
+        if content and not content.endswith(b'\n'):
+            content += b'\n'
+        content += new_line + b'\n'
+        logger.info("Added env var: %s", var_name)
     
     success, error = save_to_file(env_path, content)
     if success:
@@ -1130,37 +1359,19 @@ def add_cookies():
         return
     print("✅ Valid format")
     
-    # Test with yt-dlp
-    print("\nTesting cookies...")
-    temp_path = Path("temp_cookies_test.txt")
-    
     # Ensure final_content exists before writing
     if not final_content:
         print("❌ No content to save")
         return
     
-    temp_path.write_text(final_content)
-    
-    try:
-        success, message = test_cookies_with_ytdlp(temp_path)
-        if success:
-            print(f"✅ {message}")
-        else:
-            print(f"⚠️  Test failed: {message}")
-            confirm = input("\nSave anyway? [y/N]: ").strip().lower()
-            if confirm != 'y':
-                return
-    finally:
-        if temp_path.exists():
-            temp_path.unlink()
-    
     # Find slot (do NOT delete anything yet; we may need to merge first)
     slot = find_empty_cookies_slot()
     oldest = None
     if not slot:
         print("\n⚠️  All slots full!")
         print("� Will re-use the oldest slot after merging to preserve both domains...")
-        valid_slots = [p for p in COOKIES_PATHS[:4] if p.exists()]
+        present = existing_cookies_paths()
+        valid_slots = [p for p in COOKIES_PATHS[:4] if p in present]
         if not valid_slots:
             print("❌ No existing cookies found!")
             slot = COOKIES_PATHS[0]  # Use first slot
@@ -1169,37 +1380,64 @@ def add_cookies():
             slot = oldest
     
     # Smart merge: always try to UNION with existing file to preserve both domains
-    print(f"\n💾 Saving to: {slot}...")
-
-    if not final_content:
-        print("❌ No content to save")
-        return
-
     merged_content = final_content
-    existing_content = ""
-    if slot.exists() and slot.stat().st_size > 0:
-        try:
-            existing_content = slot.read_text(encoding='utf-8', errors='replace')
-        except Exception:
-            existing_content = ""
+    # Missing or empty slot both read as "" (no exists()/stat() pre-check)
+    try:
+        existing_content = slot.read_text(encoding='utf-8', errors='replace')
+    except Exception:
+        existing_content = ""
 
     if existing_content:
         print("\n🔄 Merging with existing cookies (deduplicate + keep newest values)...")
         merged_content = merge_netscape_cookies(existing_content, final_content)
         print(f"   ✅ Merge complete. New size: {len(merged_content):,} bytes")
     
-    # If we planned to reuse the oldest file, optionally backup before overwrite
-    if oldest is not None:
+    # Stage the merged file next to the slot: it is written once, tested in
+    # place and then atomically renamed over the slot (or dropped on failure)
+    staged_path = slot.with_suffix('.new')
+    try:
+        slot.parent.mkdir(parents=True, exist_ok=True)
+        with open(staged_path, 'wb', buffering=0) as f:
+            f.write(merged_content.encode('utf-8'))
+            os.fsync(f.fileno())  # durable before it is renamed over the slot
+    except OSError as e:
+        logger.error("OS error staging %s: %s", staged_path, e)
+        print(f"❌ Save failed: OS error: {e.strerror}")
+        return
+    
+    # Test with a live request
+    print("\nTesting cookies...")
+    success, message = test_cookies_with_http(staged_path)
+    if success:
+        print(f"✅ {message}")
+    else:
+        print(f"⚠️  Test failed: {message}")
+        confirm = input("\nSave anyway? [y/N]: ").strip().lower()
+        if confirm != 'y':
+            staged_path.unlink(missing_ok=True)
+            return
+    
+    print(f"\n💾 Saving to: {slot}...")
+    
+    # Keep the previous version: reused slots get a '.reused' backup,
+    # others the usual timestamped one
+    if existing_content:
+        timestamp = time.strftime('%Y%m%d_%H%M%S')
+        if oldest is not None:
+            backup_path = oldest.parent / f"{oldest.stem}.reused_{timestamp}.bak"
+        else:
+            backup_path = slot.with_suffix(f'.{timestamp}.bak')
         try:
-            backup_name = f"{oldest.stem}.reused_{datetime.now():%Y%m%d_%H%M%S}.bak"
-            backup_path = oldest.parent / backup_name
-            shutil.copy2(oldest, backup_path)
-            print(f"   • Backup of reused slot: {backup_name}")
-            logging.info(f"Backup created before reuse: {backup_path}")
+            link_backup(slot, backup_path)
+            if oldest is not None:
+                print(f"   • Backup of reused slot: {backup_path.name}")
+            logger.info("Created backup: %s", backup_path)
         except Exception as e:
-            logging.warning(f"Failed to backup reused slot: {e}")
-
-    success, error = save_to_file(slot, merged_content)
+            logger.warning("Failed to backup %s: %s", slot, e)
+    
+    success, error = commit_staged_file(staged_path, slot)
+    if success and oldest is None:
+        clean_old_backups(slot, keep=5)
     
     if success:
         # Verify what we saved
@@ -1243,7 +1481,7 @@ def add_gemini_api():
         return
     
     # Sanitize
-    key = key.replace('\n', '').replace('\r', '').strip('"').strip("'")
+    key = key.translate(_STRIP_NEWLINES).strip('"').strip("'")
     
     # Validate format
     print("\nValidating format...")
@@ -1276,7 +1514,7 @@ def add_gemini_api():
     choice = input("\nChoice [1/2/0] (default: 1): ").strip() or '1'
     
     if choice == '1':
-        path = SECRETS_DIR / "api_keys.txt"
+        path = API_KEYS_PATH
         success, message = append_to_api_keys(path, key)
     elif choice == '2':
         success, message = update_env_file("GEMINI_API_KEY", key)
@@ -1308,7 +1546,7 @@ def add_youtube_api():
         return
     
     # Sanitize
-    key = key.replace('\n', '').replace('\r', '').strip('"').strip("'")
+    key = key.translate(_STRIP_NEWLINES).strip('"').strip("'")
     
     # Validate format
     print("\nValidating format...")
@@ -1343,13 +1581,13 @@ def add_youtube_api():
     
     if choice == '1':
         # Dedicated YouTube folder (matches API_KEYS_PATHS priority)
-        path = SECRETS_DIR / "youtube" / "api_keys.txt"
+        path = YOUTUBE_KEYS_PATH
         # Ensure youtube folder exists
         path.parent.mkdir(parents=True, exist_ok=True)
         success, message = append_to_api_keys(path, key)
     elif choice == '2':
         # Shared file (fallback)
-        path = SECRETS_DIR / "api_keys.txt"
+        path = API_KEYS_PATH
         success, message = append_to_api_keys(path, key)
     elif choice == '3':
         success, message = update_env_file("YT_API_KEY", key)
@@ -1380,7 +1618,7 @@ def add_pexels_api():
         return
     
     # Sanitize
-    key = key.replace('\n', '').replace('\r', '').strip('"').strip("'")
+    key = key.translate(_STRIP_NEWLINES).strip('"').strip("'")
     
     # Validate format
     print("\nValidating format...")
@@ -1414,13 +1652,13 @@ def add_pexels_api():
     choice = input("\nChoice [1/2/3/0] (default: 1): ").strip() or '1'
     
     if choice == '1':
-        path = SECRETS_DIR / "pexels_key.txt"
+        path = PEXELS_KEY_PATH
         success, error = save_to_file(path, key + "\n")
         message = f"Saved to {path.name}" if success else error
     elif choice == '2':
         success, message = update_env_file("PEXELS_API_KEY", key)
     elif choice == '3':
-        path = SECRETS_DIR / "api_keys.txt"
+        path = API_KEYS_PATH
         success, message = append_to_api_keys(path, key)
     else:
         print("❌ Cancelled")
@@ -1464,290 +1702,324 @@ def option_2_add_credentials():
 # OPTION 3: STATUS CHECK
 # ============================================================================
 
+def test_keys_parallel(test_func, keys, max_workers=8):
+    """
+    Run one API test per key concurrently (capped to stay under rate limits)
+    
+    Returns:
+        dict: {key: test result}, duplicate keys are tested once
+    """
+    keys = list(dict.fromkeys(keys))
+    if not keys:
+        return {}
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(keys))) as executor:
+        return dict(zip(keys, executor.map(test_func, keys)))
+
 def check_cookies_status(test_mode):
     """
     Check cookies files status
+    
+    Returns:
+        list: Report lines (printed by run_status_checks)
     """
-    print("\n🍪 YouTube Cookies")
-    print("-" * 60)
+    lines = ["\n🍪 YouTube Cookies", "-" * 60]
     
     working = 0
     expired = 0
     
+    present = existing_cookies_paths()
     for path in COOKIES_PATHS:
-        if not path.exists():
-            print(f"  ❌ {path.name} - NOT FOUND")
+        if path not in present:
+            lines.append(f"  ❌ {path.name} - NOT FOUND")
             continue
         
         size = path.stat().st_size
-        print(f"\n  {path.name}:")
-        print(f"    Size: {size:,} bytes")
+        lines.append(f"\n  {path.name}:")
+        lines.append(f"    Size: {size:,} bytes")
         
         if test_mode == 'full':
-            success, message = test_cookies_with_ytdlp(path)
+            success, message = test_cookies_with_http(path)
             if success:
-                print(f"    ✅ WORKING - {message}")
+                lines.append(f"    ✅ WORKING - {message}")
                 working += 1
             else:
-                print(f"    ❌ EXPIRED - {message}")
+                lines.append(f"    ❌ EXPIRED - {message}")
                 expired += 1
         else:
-            print(f"    🔒 FORMAT VALID (not tested)")
+            lines.append(f"    🔒 FORMAT VALID (not tested)")
     
-    print(f"\n  📊 Summary:")
-    print(f"    ✅ Working: {working}")
-    print(f"    ❌ Expired: {expired}")
+    summary = status_summary([
+        ("✅", "Working", working),
+        ("❌", "Expired", expired)
+    ])
     if expired > 0:
-        print(f"    💡 Recommendation: Replace expired cookies")
+        summary.append(f"    💡 Recommendation: Replace expired cookies")
+    lines.extend(summary)
+    return lines
 
-def check_gemini_status(test_mode):
-    """Check Gemini API keys"""
-    print("\n🤖 Gemini API Keys")
-    print("-" * 60)
+def check_gemini_status(test_mode, api_keys=None):
+    """
+    Check Gemini API keys
+    
+    Args:
+        test_mode (str): 'full' or 'quick'
+        api_keys (list): Pre-parsed secrets/api_keys.txt (read here if None)
+    
+    Returns:
+        list: Report lines (printed by run_status_checks)
+    """
+    lines = ["\n🤖 Gemini API Keys", "-" * 60]
     
     working = 0
     quota_exceeded = 0
     invalid = 0
     
     # Check api_keys.txt
-    api_keys_path = SECRETS_DIR / "api_keys.txt"
-    if api_keys_path.exists():
-        # Parse keys and strip inline comments
-        keys = []
-        for line in api_keys_path.read_text().splitlines():
-            line = line.strip()
-            if line and not line.startswith('#'):
-                # Remove inline comments (split on # or whitespace)
-                key = line.split('#')[0].strip()
-                if key:
-                    keys.append(key)
-        
+    keys = api_keys if api_keys is not None else load_api_keys(API_KEYS_PATH)
+    if keys is not None:
+        # Test all Gemini-length keys concurrently, report in file order
+        results = test_keys_parallel(test_gemini_api, [k for k in keys if len(k) == 39]) if test_mode == 'full' else {}
         for idx, key in enumerate(keys, 1):
             # Skip if not Gemini key (check length)
             if len(key) != 39:
                 continue
                 
-            print(f"\n  Key {idx}: {mask_key(key)}")
+            lines.append(f"\n  Key {idx}: {mask_key(key)}")
             
             if test_mode == 'full':
-                success, message, details = test_gemini_api(key)
+                success, message, details = results[key]
                 if success:
-                    print(f"    ✅ ACTIVE - {message}")
-                    print(f"       Model: {details.get('model')}")
-                    print(f"       Response: {details.get('response_time')}s")
+                    lines.append(f"    ✅ ACTIVE - {message}")
+                    lines.append(f"       Model: {details.get('model')}")
+                    lines.append(f"       Response: {details.get('response_time')}s")
                     working += 1
                 elif message == "QUOTA_EXCEEDED":
-                    print(f"    ⚠️  QUOTA EXCEEDED")
+                    lines.append(f"    ⚠️  QUOTA EXCEEDED")
                     quota_exceeded += 1
                 else:
-                    print(f"    ❌ INVALID - {message}")
+                    lines.append(f"    ❌ INVALID - {message}")
                     invalid += 1
             else:
-                print(f"    🔒 FORMAT VALID (not tested)")
-    
-    # Check .env
-    env_path = SECRETS_DIR / ".env"
-    if env_path.exists():
-        content = env_path.read_text()
-        match = re.search(r'^GEMINI_API_KEY=(.+)$', content, re.MULTILINE)
-        if match:
-            key = match.group(1).strip()
-            print(f"\n  .env: {mask_key(key)}")
-            
-            if test_mode == 'full':
-                success, message, details = test_gemini_api(key)
-                if success:
-                    print(f"    ✅ ACTIVE - {message}")
-                    if details.get('model'):
-                        print(f"       Model: {details.get('model')}")
-                    if details.get('response_time'):
-                        print(f"       Response: {details.get('response_time')}s")
-                    working += 1
-                elif message == "QUOTA_EXCEEDED":
-                    print(f"    ⚠️  QUOTA EXCEEDED")
-                    quota_exceeded += 1
-                else:
-                    print(f"    ❌ {message}")
-                    invalid += 1
+                lines.append(f"    🔒 FORMAT VALID (not tested)")
     
-    print(f"\n  📊 Summary:")
-    print(f"    ✅ Working: {working}")
-    print(f"    ⚠️  Quota exceeded: {quota_exceeded}")
-    print(f"    ❌ Invalid: {invalid}")
+    # Check .env (parsed once per file version, shared by all checks)
+    key = parse_env_file(ENV_PATH).get('GEMINI_API_KEY')
+    if key:
+        lines.append(f"\n  .env: {mask_key(key)}")
+        
+        if test_mode == 'full':
+            success, message, details = test_gemini_api(key)
+            if success:
+                lines.append(f"    ✅ ACTIVE - {message}")
+                if details.get('model'):
+                    lines.append(f"       Model: {details.get('model')}")
+                if details.get('response_time'):
+                    lines.append(f"       Response: {details.get('response_time')}s")
+                working += 1
+            elif message == "QUOTA_EXCEEDED":
+                lines.append(f"    ⚠️  QUOTA EXCEEDED")
+                quota_exceeded += 1
+            else:
+                lines.append(f"    ❌ {message}")
+                invalid += 1
+
+    summary = status_summary([
+        ("✅", "Working", working),
+        ("⚠️ ", "Quota exceeded", quota_exceeded),
+        ("❌", "Invalid", invalid)
+    ])
     if quota_exceeded > 0:
-        print(f"    💡 Recommendation: Use working keys, quota resets daily")
+        summary.append(f"    💡 Recommendation: Use working keys, quota resets daily")
+    lines.extend(summary)
+    return lines
 
-def check_youtube_status(test_mode):
-    """Check YouTube API keys"""
-    print("\n📺 YouTube Data API Keys")
-    print("-" * 60)
+def check_youtube_status(test_mode, api_keys=None):
+    """
+    Check YouTube API keys
+    
+    Args:
+        test_mode (str): 'full' or 'quick'
+        api_keys (list): Pre-parsed secrets/api_keys.txt (read here if None)
+    
+    Returns:
+        list: Report lines (printed by run_status_checks)
+    """
+    lines = ["\n📺 YouTube Data API Keys", "-" * 60]
     
     working = 0
     quota_exceeded = 0
     invalid = 0
     
     # Priority 1: Check secrets/youtube/api_keys.txt (CORRECT location)
-    youtube_path = SECRETS_DIR / "youtube" / "api_keys.txt"
-    if youtube_path.exists():
-        print(f"\n  📂 youtube/api_keys.txt:")
-        keys = []
-        for line in youtube_path.read_text(encoding='utf-8').splitlines():
-            line = line.strip()
-            if line and not line.startswith('#'):
-                key = line.split('#')[0].strip()
-                if key and len(key) == 39:
-                    keys.append(key)
+    keys = load_api_keys(YOUTUBE_KEYS_PATH)
+    if keys is not None:
+        lines.append(f"\n  📂 youtube/api_keys.txt:")
+        keys = [key for key in keys if len(key) == 39]
         
         if keys:
-            print(f"    Found {len(keys)} key(s)")
+            lines.append(f"    Found {len(keys)} key(s)")
+            results = test_keys_parallel(test_youtube_api, keys) if test_mode == 'full' else {}
             for idx, key in enumerate(keys, 1):
-                print(f"\n    Key {idx}: {mask_key(key)}")
+                lines.append(f"\n    Key {idx}: {mask_key(key)}")
                 
                 if test_mode == 'full':
-                    success, message, quota = test_youtube_api(key)
+                    success, message, quota = results[key]
                     if success:
-                        print(f"      ✅ ACTIVE - {message}")
+                        lines.append(f"      ✅ ACTIVE - {message}")
                         working += 1
                     elif message == "QUOTA_EXCEEDED":
-                        print(f"      ⚠️  QUOTA EXCEEDED")
+                        lines.append(f"      ⚠️  QUOTA EXCEEDED")
                         quota_exceeded += 1
                     else:
-                        print(f"      ❌ INVALID - {message}")
+                        lines.append(f"      ❌ INVALID - {message}")
                         invalid += 1
                 else:
-                    print(f"      🔒 FORMAT VALID (not tested)")
+                    lines.append(f"      🔒 FORMAT VALID (not tested)")
         else:
-            print(f"    ⚠️  File exists but empty")
+            lines.append(f"    ⚠️  File exists but empty")
     else:
-        print(f"\n  ❌ youtube/api_keys.txt - NOT FOUND")
-        print(f"     💡 Tip: Copy keys from api_keys.txt to youtube/api_keys.txt")
+        lines.append(f"\n  ❌ youtube/api_keys.txt - NOT FOUND")
+        lines.append(f"     💡 Tip: Copy keys from api_keys.txt to youtube/api_keys.txt")
     
     # Priority 2: Check api_keys.txt (shared)
-    api_keys_path = SECRETS_DIR / "api_keys.txt"
-    if api_keys_path.exists():
-        print(f"\n  📂 api_keys.txt (shared):")
-        keys = []
-        for line in api_keys_path.read_text().splitlines():
-            line = line.strip()
-            if line and not line.startswith('#'):
-                # Remove inline comments (split on # or whitespace)
-                key = line.split('#')[0].strip()
-                if key:
-                    keys.append(key)
-        
+    keys = api_keys if api_keys is not None else load_api_keys(API_KEYS_PATH)
+    if keys is not None:
+        lines.append(f"\n  📂 api_keys.txt (shared):")
+        results = test_keys_parallel(test_youtube_api, [k for k in keys if len(k) == 39]) if test_mode == 'full' else {}
         for idx, key in enumerate(keys, 1):
             # Skip if not Google key
             if len(key) != 39:
                 continue
                 
-            print(f"\n    Key {idx}: {mask_key(key)}")
+            lines.append(f"\n    Key {idx}: {mask_key(key)}")
             
             if test_mode == 'full':
-                success, message, quota = test_youtube_api(key)
+                success, message, quota = results[key]
                 if success:
-                    print(f"      ✅ ACTIVE - {message}")
+                    lines.append(f"      ✅ ACTIVE - {message}")
                     if quota:
-                        print(f"         {quota}")
+                        lines.append(f"         {quota}")
                     working += 1
                 elif message == "QUOTA_EXCEEDED":
-                    print(f"      ⚠️  QUOTA EXCEEDED")
+                    lines.append(f"      ⚠️  QUOTA EXCEEDED")
                     quota_exceeded += 1
                 else:
-                    print(f"      ❌ INVALID - {message}")
+                    lines.append(f"      ❌ INVALID - {message}")
                     invalid += 1
             else:
-                print(f"      🔒 FORMAT VALID (not tested)")
-    
-    # Check .env
-    env_path = SECRETS_DIR / ".env"
-    if env_path.exists():
-        content = env_path.read_text()
-        match = re.search(r'^YT_API_KEY=(.+)$', content, re.MULTILINE)
-        if match:
-            key = match.group(1).strip()
-            print(f"\n  .env: {mask_key(key)}")
-            
-            if test_mode == 'full':
-                success, message, quota = test_youtube_api(key)
-                if success:
-                    print(f"    ✅ ACTIVE - {message}")
-                    if quota:
-                        print(f"       {quota}")
-                    working += 1
-                elif message == "QUOTA_EXCEEDED":
-                    print(f"    ⚠️  QUOTA EXCEEDED")
-                    quota_exceeded += 1
-                else:
-                    print(f"    ❌ {message}")
-                    invalid += 1
+                lines.append(f"      🔒 FORMAT VALID (not tested)")
     
-    print(f"\n  📊 Summary:")
-    print(f"    ✅ Working: {working}")
-    print(f"    ⚠️  Quota exceeded: {quota_exceeded}")
-    print(f"    ❌ Invalid: {invalid}")
+    # Check .env (parsed once per file version, shared by all checks)
+    key = parse_env_file(ENV_PATH).get('YT_API_KEY')
+    if key:
+        lines.append(f"\n  .env: {mask_key(key)}")
+        
+        if test_mode == 'full':
+            success, message, quota = test_youtube_api(key)
+            if success:
+                lines.append(f"    ✅ ACTIVE - {message}")
+                if quota:
+                    lines.append(f"       {quota}")
+                working += 1
+            elif message == "QUOTA_EXCEEDED":
+                lines.append(f"    ⚠️  QUOTA EXCEEDED")
+                quota_exceeded += 1
+            else:
+                lines.append(f"    ❌ {message}")
+                invalid += 1
+
+    summary = status_summary([
+        ("✅", "Working", working),
+        ("⚠️ ", "Quota exceeded", quota_exceeded),
+        ("❌", "Invalid", invalid)
+    ])
     
     if working == 0:
-        print(f"\n    ⚠️  WARNING: No working YouTube API keys found!")
-        print(f"    💡 Fix: Ensure keys exist in youtube/api_keys.txt")
+        summary.append(f"\n    ⚠️  WARNING: No working YouTube API keys found!")
+        summary.append(f"    💡 Fix: Ensure keys exist in youtube/api_keys.txt")
     elif invalid > 0:
-        print(f"    💡 Recommendation: Remove invalid keys")
+        summary.append(f"    💡 Recommendation: Remove invalid keys")
+    lines.extend(summary)
+    return lines
 
 def check_pexels_status(test_mode):
-    """Check Pexels API keys"""
-    print("\n🎬 Pexels API Key")
-    print("-" * 60)
+    """
+    Check Pexels API keys
+    
+    Returns:
+        list: Report lines (printed by run_status_checks)
+    """
+    lines = ["\n🎬 Pexels API Key", "-" * 60]
     
     working = 0
     rate_limited = 0
     invalid = 0
     
     # Check pexels_key.txt
-    pexels_path = SECRETS_DIR / "pexels_key.txt"
+    pexels_path = PEXELS_KEY_PATH
     if pexels_path.exists():
         key = pexels_path.read_text().strip()
-        print(f"\n  pexels_key.txt: {mask_key(key)}")
+        lines.append(f"\n  pexels_key.txt: {mask_key(key)}")
         
         if test_mode == 'full':
             success, message, rate_limit = test_pexels_api(key)
             if success:
-                print(f"    ✅ ACTIVE - {message}")
+                lines.append(f"    ✅ ACTIVE - {message}")
                 if rate_limit:
-                    print(f"       Rate limit: {rate_limit}")
+                    lines.append(f"       Rate limit: {rate_limit}")
                 working += 1
             elif message == "RATE_LIMITED":
-                print(f"    ⚠️  RATE LIMITED (200/hour)")
+                lines.append(f"    ⚠️  RATE LIMITED (200/hour)")
                 rate_limited += 1
             else:
-                print(f"    ❌ INVALID - {message}")
+                lines.append(f"    ❌ INVALID - {message}")
                 invalid += 1
         else:
-            print(f"    🔒 FORMAT VALID (not tested)")
-    
-    # Check .env
-    env_path = SECRETS_DIR / ".env"
-    if env_path.exists():
-        content = env_path.read_text()
-        match = re.search(r'^PEXELS_API_KEY=(.+)$', content, re.MULTILINE)
-        if match:
-            key = match.group(1).strip()
-            print(f"\n  .env: {mask_key(key)}")
-            
-            if test_mode == 'full':
-                success, message, rate_limit = test_pexels_api(key)
-                if success:
-                    print(f"    ✅ ACTIVE - {message}")
-                    if rate_limit:
-                        print(f"       Rate limit: {rate_limit}")
-                    working += 1
-                else:
-                    print(f"    ❌ {message}")
+            lines.append(f"    🔒 FORMAT VALID (not tested)")
     
-    print(f"\n  📊 Summary:")
-    print(f"    ✅ Working: {working}")
-    print(f"    ⚠️  Rate limited: {rate_limited}")
-    print(f"    ❌ Invalid: {invalid}")
+    # Check .env (parsed once per file version, shared by all checks)
+    key = parse_env_file(ENV_PATH).get('PEXELS_API_KEY')
+    if key:
+        lines.append(f"\n  .env: {mask_key(key)}")
+        
+        if test_mode == 'full':
+            success, message, rate_limit = test_pexels_api(key)
+            if success:
+                lines.append(f"    ✅ ACTIVE - {message}")
+                if rate_limit:
+                    lines.append(f"       Rate limit: {rate_limit}")
+                working += 1
+            else:
+                lines.append(f"    ❌ {message}")
+
+    summary = status_summary([
+        ("✅", "Working", working),
+        ("⚠️ ", "Rate limited", rate_limited),
+        ("❌", "Invalid", invalid)
+    ])
     if rate_limited > 0:
-        print(f"    💡 Recommendation: Wait for rate limit reset (1 hour)")
+        summary.append(f"    💡 Recommendation: Wait for rate limit reset (1 hour)")
+    lines.extend(summary)
+    return lines
+
+def run_status_checks(systems, test_mode):
+    """
+    Run check_*_status functions concurrently
+    
+    The checks are independent and network-bound, so wall time becomes the
+    slowest check instead of the sum. Each check returns its report lines;
+    reports are printed in menu order as soon as each one is ready.
+    
+    Args:
+        systems (list): (name, check_func) pairs
+        test_mode (str): 'full' or 'quick'
+    """
+    total = len(systems)
+    with ThreadPoolExecutor(max_workers=total) as executor:
+        futures = [executor.submit(func, test_mode) for _, func in systems]
+        for idx, ((name, _), future) in enumerate(zip(systems, futures), 1):
+            print_block([f"\n[{idx}/{total}] {name}...", "=" * 60] + future.result())
+            sys.stdout.flush()
 
 def option_3_status_check():
     """
@@ -1769,10 +2041,10 @@ def option_3_status_check():
     
     if choice == '1':
         test_mode = 'full'
-        logging.info("Starting FULL status check")
+        logger.info("Starting FULL status check")
     elif choice == '2':
         test_mode = 'quick'
-        logging.info("Starting QUICK status check")
+        logger.info("Starting QUICK status check")
     else:
         return
     
@@ -1781,24 +2053,23 @@ def option_3_status_check():
         print("⏳ Testing all credentials (this may take 30-60s)...")
     print("="*60)
     
+    # Shared api_keys.txt is read once for the Gemini and YouTube checks
+    api_keys = load_api_keys(API_KEYS_PATH)
+    
     # Check each system with progress
     systems = [
-        ("🤖 Gemini API", check_gemini_status),
-        ("📺 YouTube API", check_youtube_status),
+        ("🤖 Gemini API", functools.partial(check_gemini_status, api_keys=api_keys)),
+        ("📺 YouTube API", functools.partial(check_youtube_status, api_keys=api_keys)),
         ("🍪 Cookies", check_cookies_status),
         ("🎬 Pexels API", check_pexels_status)
     ]
     
-    total = len(systems)
-    for idx, (name, func) in enumerate(systems, 1):
-        print(f"\n[{idx}/{total}] {name}...")
-        print("=" * 60)
-        func(test_mode)
+    run_status_checks(systems, test_mode)
     
     print("\n" + "="*60)
     print("✅ All tests completed!")
     print("="*60)
-    logging.info("Status check completed")
+    logger.info("Status check completed")
     
     print("\nPress Enter to continue...")
     input()
@@ -1819,6 +2090,8 @@ def show_main_menu():
 
 def main():
     """Main entry point"""
+    setup_logging()
+    
     print("\n" + "="*60)
     print("🍪 Cookies & API Helper v1.1")
     print("="*60)
@@ -1845,7 +2118,7 @@ def main():
             option_3_status_check()
         elif choice == '0':
             print("\n👋 Goodbye!")
-            logging.info("Cookies Helper exited normally")
+            logger.info("Cookies Helper exited normally")
             break
         else:
             print("\n❌ Invalid choice. Try again.")
@@ -1855,9 +2128,9 @@ if __name__ == "__main__":
         main()
     except KeyboardInterrupt:
         print("\n\n⚠️  Interrupted by user")
-        logging.warning("Interrupted by user (Ctrl+C)")
+        logger.warning("Interrupted by user (Ctrl+C)")
         sys.exit(130)
     except Exception as e:
         print(f"\n❌ Fatal error: {e}")
-        logging.critical(f"Fatal error: {e}", exc_info=True)
+        logger.critical("Fatal error: %s", e, exc_info=True)
         sys.exit(1)
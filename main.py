@@ -10,30 +10,65 @@ import sys
 import os
 from pathlib import Path
 
-# Load environment variables early
-try:
-    from dotenv import load_dotenv
-    
-    root = Path(__file__).parent
-    # Load from root .env
-    if (root / ".env").exists():
-        load_dotenv(dotenv_path=str(root / ".env"))
-    # Load from secrets/.env (override)
-    if (root / "secrets" / ".env").exists():
-        load_dotenv(dotenv_path=str(root / "secrets" / ".env"))
-except ImportError:
-    pass  # dotenv not installed, skip
-
-# Add src to path
-sys.path.insert(0, str(Path(__file__).parent / "src"))
-
-# Import CLI menu
-from presentation.cli.run_menu import main as run_menu  # type: ignore
+__version__ = "2.0.0"
+
+# Resolved once at import; every path below is built from it
+_HERE = Path(__file__).resolve().parent
+_ENV_ROOT = _HERE / ".env"
+_ENV_SECRETS = _HERE / "secrets" / ".env"
+
+HELP_TEXT = """\
+usage: python main.py [-h] [--version]
+
+YouTubeTB - interactive menu for the book summary pipeline.
+Run without arguments to open the menu.
+
+options:
+  -h, --help  show this help message and exit
+  --version   show the version and exit
+"""
+
+
+def _fast_path(argv):
+    """True for flags answered without loading dotenv or the CLI menu"""
+    return len(argv) > 1 and argv[1] in {"-h", "--help", "--version"}
 
 
 def main():
     """Main entry point"""
+    # --help/--version: answer before importing the application stack
+    if _fast_path(sys.argv):
+        if sys.argv[1] == "--version":
+            print(f"YouTubeTB {__version__}")
+        else:
+            print(HELP_TEXT, end="")
+        return
+
+    # Load environment variables before the menu imports anything
+    try:
+        from dotenv import dotenv_values
+        
+        # Parse both files once (a missing file parses as empty), then
+        # apply them in a single environ update. Precedence is unchanged:
+        # process environment > root .env > secrets/.env
+        merged = {
+            **dotenv_values(_ENV_SECRETS),
+            **dotenv_values(_ENV_ROOT),
+        }
+        os.environ.update({
+            k: v for k, v in merged.items()
+            if v is not None and k not in os.environ
+        })
+    except ImportError:
+        pass  # dotenv not installed, skip
+
+    # Add src to path
+    sys.path.insert(0, str(_HERE / "src"))
+
     try:
+        # Import CLI menu (pulls in the full application stack)
+        from presentation.cli.run_menu import main as run_menu  # type: ignore
+
         run_menu()
     except KeyboardInterrupt:
         print("\n\n👋 Goodbye!")
@@ -45,4 +80,3 @@ def main():
 
 if __name__ == "__main__":
     main()
-
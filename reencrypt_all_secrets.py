@@ -1,10 +1,14 @@
 #!/usr/bin/env python3
 """
-Re-encrypt all secrets with PBKDF2 format (password: 2552025)
-This encrypts ALL files in secrets/ directory.
+Re-encrypt all secrets with scrypt format (password: 2552025)
+This encrypts ALL files in secrets/ directory, or only the known secret
+files (scripts/encrypt_secrets.py SECRET_FILES) with --only-known.
 """
 
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 from pathlib import Path
+import argparse
 import sys
 import os
 
@@ -12,67 +16,92 @@ import os
 repo_root = Path(__file__).resolve().parent
 sys.path.insert(0, str(repo_root / "scripts"))
 
-from encrypt_secrets import encrypt_file
+from encrypt_secrets import SCRYPT_HEADER, SECRET_FILES, derive_key_scrypt, make_fernet, write_encrypted
 
 # Configuration
 PASSWORD = "2552025"
 secrets_dir = repo_root / "secrets"
 encrypted_dir = repo_root / "secrets_encrypted"
 
-# Get ALL files in secrets/ directory (excluding subdirectories)
-all_files = []
-for item in secrets_dir.iterdir():
-    if item.is_file() and not item.name.startswith('.'):
-        all_files.append(item.name)
 
-existing_files = sorted(all_files)
-
-if not existing_files:
-    print("❌ No secret files found!")
-    print(f"   Looking in: {secrets_dir}")
-    sys.exit(1)
-
-print("🔐 Re-encrypting Secrets with PBKDF2 Format")
-print("=" * 60)
-print(f"📁 Found {len(existing_files)} file(s) to encrypt:")
-for fname in existing_files:
-    size = (secrets_dir / fname).stat().st_size
-    print(f"   • {fname} ({size} bytes)")
-
-# Generate random salt (same for all files in this batch)
-salt = os.urandom(16)
-
-# Create encrypted directory
-encrypted_dir.mkdir(exist_ok=True)
-
-# Encrypt each file
-print(f"\n🔒 Encrypting files with PBKDF2 (password: {PASSWORD})...")
-encrypted_count = 0
-
-for fname in existing_files:
-    file_path = secrets_dir / fname
+def encrypt_one(entry, header, fernet):
+    """Encrypt one secrets file; returns (fname, encrypted_path, error)"""
+    fname = entry.name
+    file_path = Path(entry.path)
     encrypted_path = encrypted_dir / f"{fname}.enc"
     
     try:
-        # Encrypt file
-        encrypted_data = encrypt_file(file_path, PASSWORD, salt)
-        
-        # Save encrypted file with salt prepended
-        with open(encrypted_path, 'wb') as f:
-            f.write(salt)  # First 16 bytes are the salt
-            f.write(encrypted_data)  # Rest is encrypted content
-        
-        print(f"   ✅ {fname} → {encrypted_path.name}")
-        encrypted_count += 1
-        
+        # Save encrypted file: scrypt marker + salt header, then the
+        # encrypted content (one vectored write, created 0o600)
+        write_encrypted(file_path, encrypted_path, fernet, header)
     except Exception as e:
-        print(f"   ❌ Failed to encrypt {fname}: {e}")
+        return fname, encrypted_path, e
+    return fname, encrypted_path, None
+
+
+def main(only_known=False):
+    """Re-encrypt every file in secrets/ (or only SECRET_FILES)"""
+    # Get ALL files in secrets/ directory (excluding subdirectories)
+    # One scandir pass; the DirEntry objects are carried through to the listing
+    # and the encryption loop, so each file is stat'ed at most once
+    if only_known:
+        wanted = frozenset(SECRET_FILES)
+        keep = lambda name: name in wanted
+    else:
+        keep = lambda name: not name.startswith('.')
+    with os.scandir(secrets_dir) as it:
+        existing_files = [
+            entry for entry in it
+            if entry.is_file(follow_symlinks=False) and keep(entry.name)
+        ]
+    existing_files.sort(key=lambda entry: entry.name)
+    
+    if not existing_files:
+        print("❌ No secret files found!")
+        print(f"   Looking in: {secrets_dir}")
+        sys.exit(1)
+    
+    print("🔐 Re-encrypting Secrets with scrypt Format")
+    print("=" * 60)
+    print(f"📁 Found {len(existing_files)} file(s) to encrypt:")
+    for entry in existing_files:
+        print(f"   • {entry.name} ({entry.stat(follow_symlinks=False).st_size} bytes)")
+    
+    # Generate random salt (same for all files in this batch)
+    salt = os.urandom(16)
+    
+    # Derive the key once for the whole batch (all files share the salt)
+    fernet = make_fernet(derive_key_scrypt(PASSWORD, salt))
+    
+    # Create encrypted directory
+    encrypted_dir.mkdir(exist_ok=True)
+    
+    # Encrypt each file (independent files: encrypt concurrently, report in order)
+    print(f"\n🔒 Encrypting files with scrypt (password: {PASSWORD})...")
+    encrypted_count = 0
+    
+    encrypt = partial(encrypt_one, header=SCRYPT_HEADER + salt, fernet=fernet)
+    with ThreadPoolExecutor(max_workers=min(8, len(existing_files))) as executor:
+        for fname, encrypted_path, error in executor.map(encrypt, existing_files):
+            if error is None:
+                print(f"   ✅ {fname} → {encrypted_path.name}")
+                encrypted_count += 1
+            else:
+                print(f"   ❌ Failed to encrypt {fname}: {error}")
+    
+    print(f"\n✅ Re-encryption complete!")
+    print(f"   📂 {encrypted_count}/{len(existing_files)} files encrypted")
+    print(f"   🔐 Password: {PASSWORD}")
+    print(f"\n📋 Next steps:")
+    print(f"   1. Test decryption: python scripts\\decrypt_secrets.py")
+    print(f"   2. Commit changes: git add secrets_encrypted/")
+    print(f"   3. Push to GitHub: git push")
+    print(f"\n🎯 All files now use scrypt encryption (compatible with decrypt_secrets.py)!")
+
 
-print(f"\n✅ Re-encryption complete!")
-print(f"   📂 {encrypted_count}/{len(existing_files)} files encrypted")
-print(f"   🔐 Password: {PASSWORD}")
-print(f"\n📋 Next steps:")
-print(f"   1. Test decryption: python scripts\\decrypt_secrets.py")
-print(f"   2. Commit changes: git add secrets_encrypted/")
-print(f"   3. Push to GitHub: git push")
-print(f"\n🎯 All files now use PBKDF2 encryption (compatible with decrypt_secrets.py)!")
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Re-encrypt secrets/ into secrets_encrypted/ (scrypt format).")
+    parser.add_argument("--only-known", action="store_true",
+                        help="Only encrypt the known secret files (encrypt_secrets.SECRET_FILES, incl. .env)")
+    args = parser.parse_args()
+    main(only_known=args.only_known)
@@ -7,13 +7,19 @@ Automatically detects key type and adds to appropriate file with encryption
 import os
 import sys
 import requests
+from requests.adapters import HTTPAdapter
 import json
+import re
 from pathlib import Path
-from cryptography.fernet import Fernet
-from cryptography.hazmat.primitives import hashes
-from cryptography.hazmat.primitives.kdf.pbkdf2 import PBKDF2HMAC
-import base64
 import getpass
+import hashlib
+import io
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+# .enc format (scrypt marker + parameters) and cipher, shared with the
+# other secrets scripts
+from encrypt_secrets import SCRYPT_HEADER, derive_key_scrypt, make_fernet
 
 
 # Encryption password - read from environment with fallback
@@ -27,56 +33,56 @@ def get_encryption_password() -> str:
 
 ENCRYPTION_PASSWORD = get_encryption_password()
 
+# Shared HTTP session so key probes reuse TCP/TLS connections to googleapis.com
+_HTTP_SESSION = requests.Session()
+_HTTP_SESSION.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=20))
+_HTTP_SESSION.headers.update({"User-Agent": "YouTubeTB-KeyManager/1.0"})
 
-def derive_key_from_password(password: str, salt: bytes) -> bytes:
-    """
-    Derive a Fernet encryption key from a password using PBKDF2.
-    MATCHES encrypt_secrets.py and decrypt_secrets.py implementation.
-    
-    Args:
-        password: User password
-        salt: Random salt bytes (16 bytes recommended)
-        
-    Returns:
-        32-byte encryption key suitable for Fernet
-    """
-    kdf = PBKDF2HMAC(
-        algorithm=hashes.SHA256(),
-        length=32,
-        salt=salt,
-        iterations=100000,  # High iteration count for security (matches encrypt_secrets.py)
-    )
-    key = base64.urlsafe_b64encode(kdf.derive(password.encode()))
-    return key
+GEMINI_TEST_MODEL = "gemini-2.5-flash"
 
+# Shape of a Google API key - used to reject malformed input before any network call
+_GOOGLE_KEY_RE = re.compile(r'^AIza[0-9A-Za-z_\-]{35}$')
 
-def encrypt_file(file_path: Path, password: str) -> bool:
+# Short-lived cache of probe results so repeated runs don't re-test every key
+SCAN_CACHE_FILENAME = ".api_key_scan_cache.json"
+SCAN_CACHE_TTL = 300  # seconds
+
+
+def encrypt_file(file_path: Path, salt: bytes, fernet) -> bool:
     """
-    Encrypt a single file with password using PBKDF2 (compatible with decrypt_secrets.py)
+    Encrypt a single file with a pre-derived key (compatible with decrypt_secrets.py)
+    
+    Args:
+        file_path: Path to file to encrypt
+        salt: Salt the key was derived with (prepended to the output)
+        fernet: Cipher from make_fernet(derive_key_scrypt(password, salt))
     """
     try:
-        # Generate random salt (16 bytes)
-        salt = os.urandom(16)
-        
-        # Derive key using PBKDF2
-        key = derive_key_from_password(password, salt)
-        fernet = Fernet(key)
-        
         # Read original file
-        with open(file_path, 'rb') as f:
-            data = f.read()
+        data = file_path.read_bytes()
         
-        # Encrypt
+        # Encrypt (Fernet tokens are not streamable; release the plaintext
+        # as soon as the token exists so only one large buffer stays alive)
         encrypted = fernet.encrypt(data)
+        del data
         
-        # Save to encrypted folder with salt prepended
+        # scrypt marker, then the 16-byte salt, then the encrypted
+        # content - assembled before the output is touched
+        payload = SCRYPT_HEADER + salt + encrypted
+        
+        # Save to encrypted folder via a temp file, so a failure never
+        # leaves a truncated .enc behind
         enc_dir = file_path.parent.parent / "secrets_encrypted"
         enc_dir.mkdir(exist_ok=True)
         enc_file = enc_dir / f"{file_path.name}.enc"
+        tmp_file = enc_dir / f"{file_path.name}.enc.tmp"
         
-        with open(enc_file, 'wb') as f:
-            f.write(salt)  # First 16 bytes are the salt
-            f.write(encrypted)  # Rest is encrypted content
+        try:
+            tmp_file.write_bytes(payload)
+            os.replace(tmp_file, enc_file)
+        except Exception:
+            tmp_file.unlink(missing_ok=True)
+            raise
         
         print(f"   ✅ Encrypted: {file_path.name}")
         return True
@@ -88,17 +94,16 @@ def encrypt_file(file_path: Path, password: str) -> bool:
 
 def test_youtube_api(api_key: str) -> dict:
     """Test if API key is a valid YouTube Data API key"""
-    url = "https://www.googleapis.com/youtube/v3/search"
+    # videos.list costs 1 quota unit (search.list costs 100)
+    url = "https://www.googleapis.com/youtube/v3/videos"
     params = {
-        "part": "snippet",
-        "q": "test",
-        "type": "video",
-        "maxResults": 1,
+        "part": "id",
+        "id": "dQw4w9WgXcQ",
         "key": api_key
     }
     
     try:
-        r = requests.get(url, params=params, timeout=10)
+        r = _HTTP_SESSION.get(url, params=params, timeout=10)
         
         if r.status_code == 200:
             return {
@@ -156,24 +161,27 @@ def test_youtube_api(api_key: str) -> dict:
 
 def test_gemini_api(api_key: str) -> dict:
     """Test if API key is a valid Gemini API key"""
+    # Direct REST call through the shared session: no SDK import, no
+    # process-wide genai.configure(), so probes can run in parallel
+    url = f"https://generativelanguage.googleapis.com/v1beta/models/{GEMINI_TEST_MODEL}:generateContent"
+    payload = {"contents": [{"parts": [{"text": "ping"}]}]}
+    
     try:
-        import google.generativeai as genai  # type: ignore
-        
-        # Configure with test key
-        genai.configure(api_key=api_key)  # type: ignore
+        r = _HTTP_SESSION.post(url, json=payload, headers={"x-goog-api-key": api_key}, timeout=30)
         
-        # Try to create model
-        model = genai.GenerativeModel('gemini-2.5-flash')  # type: ignore
+        if r.status_code != 200:
+            try:
+                message = r.json().get("error", {}).get("message", "")
+            except ValueError:
+                message = r.text
+            raise RuntimeError(f"{r.status_code} {message}")
         
-        # Test with simple prompt
-        response = model.generate_content("ping")
-        
-        if response:
+        if r.json().get("candidates"):
             return {
                 "type": "gemini",
                 "valid": True,
                 "status": "✅ Working",
-                "model": "gemini-2.5-flash"
+                "model": GEMINI_TEST_MODEL
             }
         else:
             return {
@@ -222,15 +230,24 @@ def detect_api_type(api_key: str) -> dict:
         "works_on_both": False
     }
     
-    # Test YouTube first (faster)
+    # Google API keys have a fixed shape - reject typos without any network call
+    if not _GOOGLE_KEY_RE.match(api_key):
+        results["reason"] = "format"
+        print("❌ Not a Google API key (expected 'AIza' + 35 characters)")
+        return results
+    
+    # Test both services in parallel (network-bound)
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        youtube_future = executor.submit(test_youtube_api, api_key)
+        gemini_future = executor.submit(test_gemini_api, api_key)
+        youtube_result = youtube_future.result()
+        gemini_result = gemini_future.result()
+    
     print("📺 Testing YouTube Data API...")
-    youtube_result = test_youtube_api(api_key)
     results["youtube"] = youtube_result
     print(f"   {youtube_result['status']}")
     
-    # Always test Gemini too
     print("\n🤖 Testing Gemini AI API...")
-    gemini_result = test_gemini_api(api_key)
     results["gemini"] = gemini_result
     print(f"   {gemini_result['status']}")
     
@@ -261,104 +278,94 @@ def detect_api_type(api_key: str) -> dict:
     return results
 
 
-def add_key_to_file(api_key: str, key_type: str, repo_root: Path) -> bool:
-    """Add API key to appropriate file based on type"""
+def load_key_set(file_path: Path) -> set:
+    """Parse a key file into a set of keys (skips blanks and # comments)"""
+    if not file_path.exists():
+        return set()
+    # Keys are pure ASCII - parse raw bytes and decode only the kept lines
+    content = file_path.read_bytes()
+    return {s.decode() for line in content.splitlines()
+            if (s := line.strip()) and not s.startswith(b'#')}
+
+
+def key_sets_from_results(existing_results: dict) -> dict:
+    """Build per-service key sets from scan_existing_keys() results"""
+    return {
+        service: {item["key"] for item in existing_results[service]}
+        for service in ["youtube", "gemini"]
+    }
+
+
+# Key file per service: (file name in secrets/, display name, header for new files)
+KEY_FILES = {
+    "youtube": ("api_keys.txt", "YouTube Data API", "# YouTube Data API Keys\n"),
+    "gemini": ("api_key.txt", "Gemini AI API", None),
+}
+
+
+def append_key(path: Path, key: str, existing: set, header: str | None = None) -> bool:
+    """
+    Append key to a key file unless it is already in existing.
+    
+    Creates the file (with header, if given) when missing. Returns True if
+    the key was written.
+    """
+    if key in existing:
+        return False
     
-    success_count = 0
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, 'a+b') as f:
+        size = f.seek(0, os.SEEK_END)
+        if size == 0:
+            if header:
+                f.write(header.encode())
+        else:
+            # Existing file may not end with a newline
+            f.seek(size - 1)
+            if f.read(1) != b"\n":
+                f.write(b"\n")
+        f.write(key.encode() + b"\n")
+    return True
+
+
+def add_key_to_file(api_key: str, key_type: str, repo_root: Path,
+                    existing_keys: dict | None = None) -> bool:
+    """
+    Add API key to appropriate file based on type.
     
-    # Handle "both" type - add to both files
+    Args:
+        existing_keys: Per-service key sets (see key_sets_from_results). When
+            given, the key files are not re-read for the duplicate check.
+    """
     if key_type == "both":
         print(f"\n📂 Adding to BOTH YouTube and Gemini files...")
-        
-        # Add to YouTube
-        yt_file = repo_root / "secrets" / "api_keys.txt"
-        if yt_file.exists():
-            existing_content = yt_file.read_text(encoding="utf-8")
-            if api_key in existing_content:
-                print(f"   ⚠️  Already exists in api_keys.txt")
-            else:
-                with open(yt_file, 'a', encoding="utf-8") as f:
-                    f.write(f"\n{api_key}")
-                print(f"   ✅ Added to api_keys.txt (YouTube)")
-                success_count += 1
-        else:
-            yt_file.parent.mkdir(parents=True, exist_ok=True)
-            with open(yt_file, 'w', encoding="utf-8") as f:
-                f.write(f"# YouTube Data API Keys\n")
-                f.write(f"{api_key}\n")
-            print(f"   ✅ Created api_keys.txt and added key (YouTube)")
-            success_count += 1
-        
-        # Add to Gemini
-        gemini_file = repo_root / "secrets" / "api_key.txt"
-        if gemini_file.exists():
-            existing_content = gemini_file.read_text(encoding="utf-8")
-            if api_key in existing_content:
-                print(f"   ⚠️  Already exists in api_key.txt")
-            else:
-                # Append to multi-line Gemini file
-                with open(gemini_file, 'a', encoding="utf-8") as f:
-                    f.write(f"\n{api_key}")
-                print(f"   ✅ Added to api_key.txt (Gemini)")
-                success_count += 1
-        else:
-            gemini_file.parent.mkdir(parents=True, exist_ok=True)
-            gemini_file.write_text(api_key, encoding="utf-8")
-            print(f"   ✅ Created api_key.txt and added key (Gemini)")
-            success_count += 1
-        
-        return success_count > 0
-    
-    # Handle single service types
-    if key_type == "youtube":
-        file_path = repo_root / "secrets" / "api_keys.txt"
-        key_name = "YouTube Data API"
-    elif key_type == "gemini":
-        file_path = repo_root / "secrets" / "api_key.txt"
-        key_name = "Gemini AI API"
+        services = ["youtube", "gemini"]
+    elif key_type in KEY_FILES:
+        services = [key_type]
     else:
         print(f"❌ Unknown key type: {key_type}")
         return False
     
-    # Check if key already exists
-    if file_path.exists():
-        existing_content = file_path.read_text(encoding="utf-8")
-        if api_key in existing_content:
-            print(f"⚠️  Key already exists in {file_path.name}")
-            return False
-    
-    # Add key to file
+    added_count = 0
     try:
-        # For YouTube (multi-key file)
-        if key_type == "youtube":
-            if file_path.exists():
-                content = file_path.read_text(encoding="utf-8")
-                # Add new key at the end
-                with open(file_path, 'a', encoding="utf-8") as f:
-                    f.write(f"\n{api_key}")
+        for service in services:
+            filename, key_name, header = KEY_FILES[service]
+            file_path = repo_root / "secrets" / filename
+            if existing_keys is not None:
+                existing = existing_keys.get(service, set())
             else:
-                # Create new file
-                file_path.parent.mkdir(parents=True, exist_ok=True)
-                with open(file_path, 'w', encoding="utf-8") as f:
-                    f.write(f"# YouTube Data API Keys\n")
-                    f.write(f"{api_key}\n")
-        
-        # For Gemini (single-key file)
-        elif key_type == "gemini":
-            file_path.parent.mkdir(parents=True, exist_ok=True)
-            if file_path.exists():
-                # Append to multi-line file
-                with open(file_path, 'a', encoding="utf-8") as f:
-                    f.write(f"\n{api_key}")
+                existing = load_key_set(file_path)
+            
+            if append_key(file_path, api_key, existing, header):
+                print(f"   ✅ Added {key_name} key to {filename}")
+                added_count += 1
             else:
-                file_path.write_text(api_key, encoding="utf-8")
-        
-        print(f"✅ Added {key_name} key to {file_path.name}")
-        return True
-        
+                print(f"   ⚠️  Key already exists in {filename}")
     except Exception as e:
         print(f"❌ Failed to add key: {e}")
         return False
+    
+    return added_count > 0
 
 
 def auto_encrypt_secrets(repo_root: Path) -> bool:
@@ -381,11 +388,15 @@ def auto_encrypt_secrets(repo_root: Path) -> bool:
         ".env"
     ]
     
+    # Derive the key once per batch - the KDF dominates encryption time
+    salt = os.urandom(16)
+    fernet = make_fernet(derive_key_scrypt(ENCRYPTION_PASSWORD, salt))
+    
     encrypted_count = 0
     for filename in files_to_encrypt:
         file_path = secrets_dir / filename
         if file_path.exists():
-            if encrypt_file(file_path, ENCRYPTION_PASSWORD):
+            if encrypt_file(file_path, salt, fernet):
                 encrypted_count += 1
     
     print(f"\n✅ Encrypted {encrypted_count} file(s)")
@@ -414,7 +425,7 @@ def auto_git_push(repo_root: Path) -> bool:
         
         # Commit
         result = subprocess.run(
-            ["git", "commit", "-m", "Auto-add API key with encryption"],
+            ["git", "commit", "--quiet", "-m", "Auto-add API key with encryption"],
             cwd=repo_root,
             capture_output=True,
             text=True
@@ -432,7 +443,7 @@ def auto_git_push(repo_root: Path) -> bool:
         
         # Push
         result = subprocess.run(
-            ["git", "push", "origin", "master"],
+            ["git", "push", "--quiet", "origin", "master"],
             cwd=repo_root,
             capture_output=True,
             text=True
@@ -450,6 +461,75 @@ def auto_git_push(repo_root: Path) -> bool:
         return False
 
 
+def load_scan_cache(repo_root: Path) -> dict:
+    """Load cached probe results (empty dict if missing or corrupt)"""
+    try:
+        cache = json.loads((repo_root / SCAN_CACHE_FILENAME).read_text(encoding="utf-8"))
+        return cache if isinstance(cache, dict) else {}
+    except Exception:
+        return {}
+
+
+def save_scan_cache(repo_root: Path, cache: dict):
+    """Persist probe results, silently ignoring write errors"""
+    try:
+        (repo_root / SCAN_CACHE_FILENAME).write_text(json.dumps(cache), encoding="utf-8")
+    except Exception:
+        pass
+
+
+def invalidate_scan_cache(repo_root: Path):
+    """Drop cached probe results after key files change"""
+    try:
+        (repo_root / SCAN_CACHE_FILENAME).unlink(missing_ok=True)
+    except Exception:
+        pass
+
+
+def scan_cache_key(service: str, api_key: str) -> str:
+    """Cache entry name for a key (hashed so raw keys never hit the cache file)"""
+    return hashlib.sha256(f"{service}:{api_key}".encode()).hexdigest()[:16]
+
+
+def probe_keys_parallel(keys: list, test_func, service: str, cache: dict) -> list:
+    """
+    Run test_func on every key concurrently, returning results in key order.
+    
+    Fresh entries in cache are reused instead of probing; live results are
+    written back into cache.
+    """
+    now = time.time()
+    results = [None] * len(keys)
+    misses = []
+    
+    for idx, key in enumerate(keys):
+        # Corrupt lines are reported without probing
+        if not _GOOGLE_KEY_RE.match(key):
+            results[idx] = {
+                "type": service,
+                "valid": False,
+                "status": "❌ Invalid format",
+                "error": "Not a Google API key"
+            }
+            continue
+        entry = cache.get(scan_cache_key(service, key))
+        if entry and now - entry.get("ts", 0) < SCAN_CACHE_TTL:
+            results[idx] = entry["result"]
+        else:
+            misses.append(idx)
+    
+    if misses:
+        with ThreadPoolExecutor(max_workers=min(16, len(misses))) as executor:
+            futures = {idx: executor.submit(test_func, keys[idx]) for idx in misses}
+            for idx, future in futures.items():
+                results[idx] = future.result()
+                # Don't pin transient network failures in the cache
+                if results[idx]["status"] not in ("❌ Timeout", "❌ Error"):
+                    cache[scan_cache_key(service, keys[idx])] = {"ts": now, "result": results[idx]}
+    
+    return results
+
+
 def scan_existing_keys(repo_root: Path) -> dict:
     """Scan and test all existing API keys"""
     print("\n🔍 Scanning existing API keys...")
@@ -459,104 +539,131 @@ def scan_existing_keys(repo_root: Path) -> dict:
         "youtube": [],
         "gemini": []
     }
+    cache = load_scan_cache(repo_root)
+    
+    # Per-key output is buffered and written once per run
+    buf = io.StringIO()
     
     # Scan YouTube keys
     yt_file = repo_root / "secrets" / "api_keys.txt"
     if yt_file.exists():
-        print("\n📺 YouTube Data API Keys:")
-        print("-" * 60)
-        content = yt_file.read_text(encoding="utf-8")
-        keys = [line.strip() for line in content.split('\n') 
-                if line.strip() and not line.strip().startswith('#')]
+        print("\n📺 YouTube Data API Keys:", file=buf)
+        print("-" * 60, file=buf)
+        content = yt_file.read_bytes()
+        keys = [s.decode() for line in content.splitlines()
+                if (s := line.strip()) and not s.startswith(b'#')]
         
-        for idx, key in enumerate(keys, 1):
-            print(f"\n🔑 Key #{idx}: {key[:10]}...{key[-4:]}")
-            result = test_youtube_api(key)
+        key_results = probe_keys_parallel(keys, test_youtube_api, "youtube", cache)
+        
+        for idx, (key, result) in enumerate(zip(keys, key_results), 1):
+            print(f"\n🔑 Key #{idx}: {key[:10]}...{key[-4:]}", file=buf)
             results["youtube"].append({
                 "key": key,
                 "index": idx,
                 "result": result
             })
-            print(f"   Status: {result['status']}")
+            print(f"   Status: {result['status']}", file=buf)
             if result.get("quota"):
-                print(f"   Quota: {result['quota']}")
+                print(f"   Quota: {result['quota']}", file=buf)
             if result.get("error"):
-                print(f"   Error: {result['error']}")
+                print(f"   Error: {result['error']}", file=buf)
     else:
-        print("\n📺 No YouTube API keys found")
+        print("\n📺 No YouTube API keys found", file=buf)
     
     # Scan Gemini keys
     gemini_file = repo_root / "secrets" / "api_key.txt"
     if gemini_file.exists():
-        print("\n\n🤖 Gemini AI API Keys:")
-        print("-" * 60)
-        content = gemini_file.read_text(encoding="utf-8").strip()
-        keys = [line.strip() for line in content.split('\n') 
-                if line.strip() and not line.strip().startswith('#')]
+        print("\n\n🤖 Gemini AI API Keys:", file=buf)
+        print("-" * 60, file=buf)
+        content = gemini_file.read_bytes()
+        keys = [s.decode() for line in content.splitlines()
+                if (s := line.strip()) and not s.startswith(b'#')]
+        
+        key_results = probe_keys_parallel(keys, test_gemini_api, "gemini", cache)
         
-        for idx, key in enumerate(keys, 1):
-            print(f"\n🔑 Key #{idx}: {key[:10]}...{key[-4:]}")
-            result = test_gemini_api(key)
+        for idx, (key, result) in enumerate(zip(keys, key_results), 1):
+            print(f"\n🔑 Key #{idx}: {key[:10]}...{key[-4:]}", file=buf)
             results["gemini"].append({
                 "key": key,
                 "index": idx,
                 "result": result
             })
-            print(f"   Status: {result['status']}")
+            print(f"   Status: {result['status']}", file=buf)
             if result.get("model"):
-                print(f"   Model: {result['model']}")
+                print(f"   Model: {result['model']}", file=buf)
             if result.get("error"):
-                print(f"   Error: {result['error']}")
+                print(f"   Error: {result['error']}", file=buf)
     else:
-        print("\n\n🤖 No Gemini API keys found")
+        print("\n\n🤖 No Gemini API keys found", file=buf)
+    
+    sys.stdout.write(buf.getvalue())
+    sys.stdout.flush()
     
+    save_scan_cache(repo_root, cache)
     return results
 
 
 def check_duplicate(api_key: str, existing_results: dict) -> dict:
     """Check if key already exists"""
+    # Index all scanned keys once (first occurrence wins, YouTube before Gemini)
+    known = {}
     for service in ["youtube", "gemini"]:
         for item in existing_results[service]:
-            if item["key"] == api_key:
-                return {
-                    "is_duplicate": True,
-                    "service": service,
-                    "index": item["index"],
-                    "status": item["result"]["status"]
-                }
+            known.setdefault(item["key"], (service, item))
+    
+    if api_key in known:
+        service, item = known[api_key]
+        return {
+            "is_duplicate": True,
+            "service": service,
+            "index": item["index"],
+            "status": item["result"]["status"]
+        }
     
     return {"is_duplicate": False}
 
 
+def tally_key_statuses(keys: list) -> tuple:
+    """Count (working, quota_exceeded, failed) keys in one pass"""
+    working = quota_exceeded = 0
+    for k in keys:
+        status = k["result"]["status"].lower()
+        if "quota exceeded" in status:
+            quota_exceeded += 1
+        elif k["result"]["valid"]:
+            working += 1
+    return working, quota_exceeded, len(keys) - working - quota_exceeded
+
+
 def print_summary(existing_results: dict):
     """Print summary of all keys"""
-    print("\n" + "="*60)
-    print("📊 SUMMARY OF ALL KEYS")
-    print("="*60)
+    buf = io.StringIO()
+    print("\n" + "="*60, file=buf)
+    print("📊 SUMMARY OF ALL KEYS", file=buf)
+    print("="*60, file=buf)
     
     # YouTube summary
     yt_keys = existing_results["youtube"]
     if yt_keys:
-        print(f"\n📺 YouTube Data API ({len(yt_keys)} keys):")
-        working = sum(1 for k in yt_keys if k["result"]["valid"])
-        quota_exceeded = sum(1 for k in yt_keys if "quota exceeded" in k["result"]["status"].lower())
-        failed = len(yt_keys) - working - quota_exceeded
+        print(f"\n📺 YouTube Data API ({len(yt_keys)} keys):", file=buf)
+        working, quota_exceeded, failed = tally_key_statuses(yt_keys)
         
-        print(f"   ✅ Working: {working}")
-        print(f"   ⚠️  Quota Exceeded: {quota_exceeded}")
-        print(f"   ❌ Failed/Blocked: {failed}")
+        print(f"   ✅ Working: {working}", file=buf)
+        print(f"   ⚠️  Quota Exceeded: {quota_exceeded}", file=buf)
+        print(f"   ❌ Failed/Blocked: {failed}", file=buf)
     
     # Gemini summary
     gemini_keys = existing_results["gemini"]
     if gemini_keys:
-        print(f"\n🤖 Gemini AI API ({len(gemini_keys)} keys):")
-        working = sum(1 for k in gemini_keys if k["result"]["valid"])
-        quota_exceeded = sum(1 for k in gemini_keys if "quota exceeded" in k["result"]["status"].lower())
-        failed = len(gemini_keys) - working - quota_exceeded
+        print(f"\n🤖 Gemini AI API ({len(gemini_keys)} keys):", file=buf)
+        working, quota_exceeded, failed = tally_key_statuses(gemini_keys)
         
-        print(f"   ✅ Working: {working}")
-        print(f"   ⚠️  Quota Exceeded: {quota_exceeded}")
-        print(f"   ❌ Failed/Invalid: {failed}")
+        print(f"   ✅ Working: {working}", file=buf)
+        print(f"   ⚠️  Quota Exceeded: {quota_exceeded}", file=buf)
+        print(f"   ❌ Failed/Invalid: {failed}", file=buf)
+    
+    sys.stdout.write(buf.getvalue())
+    sys.stdout.flush()
 
 
 def main():
@@ -609,9 +716,10 @@ def main():
     
     # Add to appropriate file
     print(f"\n📂 Adding key to {key_type} file...")
-    if not add_key_to_file(api_key, key_type, repo_root):
+    if not add_key_to_file(api_key, key_type, repo_root, key_sets_from_results(existing_results)):
         print("❌ Failed to add key to file")
         return
+    invalidate_scan_cache(repo_root)
     
     # Auto-encrypt
     if not auto_encrypt_secrets(repo_root):
@@ -622,24 +730,27 @@ def main():
     if not auto_git_push(repo_root):
         print("⚠️  Failed to push to GitHub (manual push required)")
     
-    print("\n" + "="*60)
-    print("✅ ALL DONE!")
-    print("="*60)
-    print(f"\n📊 Summary:")
+    buf = io.StringIO()
+    print("\n" + "="*60, file=buf)
+    print("✅ ALL DONE!", file=buf)
+    print("="*60, file=buf)
+    print(f"\n📊 Summary:", file=buf)
     
     if key_type == "both":
-        print(f"  • API Type: BOTH (YouTube + Gemini)")
-        print(f"  • YouTube Status: {detection['youtube']['status']}")
-        print(f"  • Gemini Status: {detection['gemini']['status']}")
-        print(f"  • Files: api_keys.txt + api_key.txt")
+        print(f"  • API Type: BOTH (YouTube + Gemini)", file=buf)
+        print(f"  • YouTube Status: {detection['youtube']['status']}", file=buf)
+        print(f"  • Gemini Status: {detection['gemini']['status']}", file=buf)
+        print(f"  • Files: api_keys.txt + api_key.txt", file=buf)
     else:
-        print(f"  • API Type: {key_type.upper()}")
-        print(f"  • Status: {detection[key_type]['status']}")
-        print(f"  • File: secrets/{'api_keys.txt' if key_type == 'youtube' else 'api_key.txt'}")
-    
-    print(f"  • Encrypted: ✅")
-    print(f"  • Pushed: ✅")
-    print("\n🎉 Key is ready to use!")
+        print(f"  • API Type: {key_type.upper()}", file=buf)
+        print(f"  • Status: {detection[key_type]['status']}", file=buf)
+        print(f"  • File: secrets/{'api_keys.txt' if key_type == 'youtube' else 'api_key.txt'}", file=buf)
+    
+    print(f"  • Encrypted: ✅", file=buf)
+    print(f"  • Pushed: ✅", file=buf)
+    print("\n🎉 Key is ready to use!", file=buf)
+    sys.stdout.write(buf.getvalue())
+    sys.stdout.flush()
 
 
 if __name__ == "__main__":
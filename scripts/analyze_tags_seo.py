@@ -3,6 +3,53 @@ YouTube SEO Analysis for Generated Tags
 Analyzes tags based on YouTube's ranking factors
 """
 
+import re
+import sys
+
+
+def _any_of(words):
+    """One compiled alternation: same result as any(word in t for word in words)"""
+    return re.compile('|'.join(map(re.escape, words)))
+
+
+# Exact-match tag sets
+HIGH_VOLUME = frozenset({
+    'book summary', 'audiobook', 'self improvement', 'self help',
+    'motivation', 'productivity', 'psychology', 'success',
+    'personal development', 'book review', 'bestseller'
+})
+HIGH_COMPETITION = frozenset({
+    'motivation', 'success', 'productivity', 'book summary',
+    'self help', 'audiobook', 'bestseller'
+})
+
+# Substring keyword groups (one regex scan per tag instead of a Python loop)
+MEDIUM_VOLUME_WORDS = _any_of([
+    'habits', 'mindset', 'growth', 'entrepreneur', 'booktok',
+    'trending', 'student', 'reader', 'lesson'
+])
+BOOK_WORDS = _any_of(['atomic habits', 'james clear'])
+TOPIC_WORDS = _any_of([
+    'habit', 'tiny', 'percent', 'stacking', 'loop', 'formation'
+])
+LOW_COMPETITION_PHRASES = _any_of([
+    'habit stacking', '1 percent', 'tiny changes', 'habit loop',
+    'james clear atomic', 'improve daily'
+])
+VIRAL_WORDS = _any_of([
+    'booktok', 'trending', 'viral', 'must read', 'top books',
+    'bestseller'
+])
+AUDIENCE_WORDS = _any_of([
+    'student', 'entrepreneur', 'reader', 'learner', 'professional',
+    'book lover'
+])
+SEARCH_PHRASES = _any_of([
+    'how to', 'best', 'tips', 'guide', 'explained', 'learn',
+    'improve', 'better', 'change your'
+])
+
+
 def analyze_tags_seo(tags_string):
     """
     Analyze tags from YouTube SEO perspective
@@ -10,36 +57,72 @@ def analyze_tags_seo(tags_string):
     
     tags = [tag.strip() for tag in tags_string.split(',')]
     
-    print("=" * 80)
-    print("🎯 YouTube SEO Analysis for Tags")
-    print("=" * 80)
+    # Report lines are collected and written to stdout once at the end
+    out = []
+    emit = out.append
+    
+    # Counts are shown against the real tag count; the divisor and suffix
+    # are computed once instead of per line
+    total = len(tags)
+    inv100 = 100.0 / total
+    denom = f'/{total}'
+    
+    def share(items):
+        return f"{len(items)}{denom} ({len(items) * inv100:.0f}%)"
+    
+    # Classify every tag in a single pass (lists keep tag order)
+    high_volume, medium_volume, long_tail = [], [], []
+    book_specific, topic_specific = [], []
+    short_tags, medium_tags, long_tags = [], [], []
+    high_comp, low_comp = [], []
+    viral_tags, audience_tags, search_phrases = [], [], []
+    for t in tags:
+        words = len(t.split())
+        is_high_volume = t in HIGH_VOLUME
+        if is_high_volume:
+            high_volume.append(t)
+        else:
+            if MEDIUM_VOLUME_WORDS.search(t):
+                medium_volume.append(t)
+            if words >= 3:
+                long_tail.append(t)
+        if BOOK_WORDS.search(t):
+            book_specific.append(t)
+        if TOPIC_WORDS.search(t):
+            topic_specific.append(t)
+        if words == 1:
+            short_tags.append(t)
+        elif words == 2:
+            medium_tags.append(t)
+        elif words >= 3:
+            long_tags.append(t)
+        if t in HIGH_COMPETITION:
+            high_comp.append(t)
+        if LOW_COMPETITION_PHRASES.search(t):
+            low_comp.append(t)
+        if VIRAL_WORDS.search(t):
+            viral_tags.append(t)
+        if AUDIENCE_WORDS.search(t):
+            audience_tags.append(t)
+        if SEARCH_PHRASES.search(t):
+            search_phrases.append(t)
+    
+    emit("=" * 80)
+    emit("🎯 YouTube SEO Analysis for Tags")
+    emit("=" * 80)
     
     # 1. SEARCH VOLUME POTENTIAL
-    print("\n📊 1. SEARCH VOLUME POTENTIAL")
-    print("-" * 80)
-    
-    # High-volume generic tags (broad appeal)
-    high_volume = [t for t in tags if t in [
-        'book summary', 'audiobook', 'self improvement', 'self help',
-        'motivation', 'productivity', 'psychology', 'success',
-        'personal development', 'book review', 'bestseller'
-    ]]
-    
-    # Medium-volume niche tags (targeted)
-    medium_volume = [t for t in tags if any(word in t for word in [
-        'habits', 'mindset', 'growth', 'entrepreneur', 'booktok',
-        'trending', 'student', 'reader', 'lesson'
-    ]) and t not in high_volume]
-    
-    # Low-volume long-tail (specific, high conversion)
-    long_tail = [t for t in tags if len(t.split()) >= 3 and t not in high_volume]
-    
-    print(f"   ✅ High-volume tags: {len(high_volume)}/44 ({len(high_volume)/44*100:.0f}%)")
-    print(f"      Examples: {', '.join(high_volume[:5])}")
-    print(f"   ⚡ Medium-volume tags: {len(medium_volume)}/44 ({len(medium_volume)/44*100:.0f}%)")
-    print(f"      Examples: {', '.join(medium_volume[:5]) if medium_volume else 'None'}")
-    print(f"   🎯 Long-tail tags: {len(long_tail)}/44 ({len(long_tail)/44*100:.0f}%)")
-    print(f"      Examples: {', '.join(long_tail[:3]) if long_tail else 'None'}")
+    emit("\n📊 1. SEARCH VOLUME POTENTIAL")
+    emit("-" * 80)
+    
+    # High-volume generic tags (broad appeal), medium-volume niche tags
+    # (targeted) and low-volume long-tail (specific, high conversion)
+    emit(f"   ✅ High-volume tags: {share(high_volume)}")
+    emit(f"      Examples: {', '.join(high_volume[:5])}")
+    emit(f"   ⚡ Medium-volume tags: {share(medium_volume)}")
+    emit(f"      Examples: {', '.join(medium_volume[:5]) if medium_volume else 'None'}")
+    emit(f"   🎯 Long-tail tags: {share(long_tail)}")
+    emit(f"      Examples: {', '.join(long_tail[:3]) if long_tail else 'None'}")
     
     # SEO Score for search volume
     volume_score = 0
@@ -57,42 +140,31 @@ def analyze_tags_seo(tags_string):
     else:
         volume_score += 5
     
-    print(f"\n   📈 Search Volume Score: {volume_score}/50")
+    emit(f"\n   📈 Search Volume Score: {volume_score}/50")
     
     # 2. KEYWORD RELEVANCE
-    print("\n🎯 2. KEYWORD RELEVANCE & SPECIFICITY")
-    print("-" * 80)
+    emit("\n🎯 2. KEYWORD RELEVANCE & SPECIFICITY")
+    emit("-" * 80)
     
-    # Check for book-specific tags
-    book_specific = [t for t in tags if 'atomic habits' in t or 'james clear' in t]
-    
-    # Check for topic-specific tags
-    topic_specific = [t for t in tags if any(word in t for word in [
-        'habit', 'tiny', 'percent', 'stacking', 'loop', 'formation'
-    ])]
-    
-    print(f"   ✅ Book-specific tags: {len(book_specific)}/44 ({len(book_specific)/44*100:.0f}%)")
-    print(f"      {', '.join(book_specific[:5])}")
-    print(f"   ✅ Topic-specific tags: {len(topic_specific)}/44 ({len(topic_specific)/44*100:.0f}%)")
-    print(f"      {', '.join(topic_specific[:5])}")
+    # Book-specific and topic-specific tags
+    emit(f"   ✅ Book-specific tags: {share(book_specific)}")
+    emit(f"      {', '.join(book_specific[:5])}")
+    emit(f"   ✅ Topic-specific tags: {share(topic_specific)}")
+    emit(f"      {', '.join(topic_specific[:5])}")
     
     relevance_score = min(50, (len(book_specific) + len(topic_specific)) * 3)
-    print(f"\n   📈 Relevance Score: {relevance_score}/50")
+    emit(f"\n   📈 Relevance Score: {relevance_score}/50")
     
     # 3. TAG LENGTH DISTRIBUTION
-    print("\n📏 3. TAG LENGTH DISTRIBUTION")
-    print("-" * 80)
+    emit("\n📏 3. TAG LENGTH DISTRIBUTION")
+    emit("-" * 80)
     
-    short_tags = [t for t in tags if len(t.split()) == 1]
-    medium_tags = [t for t in tags if len(t.split()) == 2]
-    long_tags = [t for t in tags if len(t.split()) >= 3]
-    
-    print(f"   • 1-word tags: {len(short_tags)}/44 ({len(short_tags)/44*100:.0f}%)")
-    print(f"     Examples: {', '.join(short_tags[:5])}")
-    print(f"   • 2-word tags: {len(medium_tags)}/44 ({len(medium_tags)/44*100:.0f}%)")
-    print(f"     Examples: {', '.join(medium_tags[:5])}")
-    print(f"   • 3+ word tags: {len(long_tags)}/44 ({len(long_tags)/44*100:.0f}%)")
-    print(f"     Examples: {', '.join(long_tags[:3])}")
+    emit(f"   • 1-word tags: {share(short_tags)}")
+    emit(f"     Examples: {', '.join(short_tags[:5])}")
+    emit(f"   • 2-word tags: {share(medium_tags)}")
+    emit(f"     Examples: {', '.join(medium_tags[:5])}")
+    emit(f"   • 3+ word tags: {share(long_tags)}")
+    emit(f"     Examples: {', '.join(long_tags[:3])}")
     
     # Ideal distribution: 20% short, 50% medium, 30% long
     distribution_score = 0
@@ -103,28 +175,18 @@ def analyze_tags_seo(tags_string):
     if 10 <= len(long_tags) <= 20:   # ~30% = 13 tags
         distribution_score += 20
     
-    print(f"\n   📈 Distribution Score: {distribution_score}/50")
+    emit(f"\n   📈 Distribution Score: {distribution_score}/50")
     
     # 4. COMPETITION ANALYSIS
-    print("\n⚔️ 4. COMPETITION LEVEL")
-    print("-" * 80)
-    
-    # High competition (everyone uses these)
-    high_comp = [t for t in tags if t in [
-        'motivation', 'success', 'productivity', 'book summary',
-        'self help', 'audiobook', 'bestseller'
-    ]]
-    
-    # Low competition (specific, less saturated)
-    low_comp = [t for t in tags if any(phrase in t for phrase in [
-        'habit stacking', '1 percent', 'tiny changes', 'habit loop',
-        'james clear atomic', 'improve daily'
-    ])]
-    
-    print(f"   ⚠️ High-competition tags: {len(high_comp)}/44")
-    print(f"      {', '.join(high_comp[:5])}")
-    print(f"   ✅ Low-competition tags: {len(low_comp)}/44")
-    print(f"      {', '.join(low_comp[:5]) if low_comp else 'None'}")
+    emit("\n⚔️ 4. COMPETITION LEVEL")
+    emit("-" * 80)
+    
+    # High competition (everyone uses these) vs low competition (specific,
+    # less saturated)
+    emit(f"   ⚠️ High-competition tags: {len(high_comp)}{denom}")
+    emit(f"      {', '.join(high_comp[:5])}")
+    emit(f"   ✅ Low-competition tags: {len(low_comp)}{denom}")
+    emit(f"      {', '.join(low_comp[:5]) if low_comp else 'None'}")
     
     # Balance is key: 60% high-comp, 40% low-comp
     comp_score = 0
@@ -135,57 +197,42 @@ def analyze_tags_seo(tags_string):
     else:
         comp_score += 10
     
-    print(f"\n   📈 Competition Balance Score: {comp_score}/30")
+    emit(f"\n   📈 Competition Balance Score: {comp_score}/30")
     
     # 5. VIRAL POTENTIAL
-    print("\n🔥 5. VIRAL & TRENDING TAGS")
-    print("-" * 80)
+    emit("\n🔥 5. VIRAL & TRENDING TAGS")
+    emit("-" * 80)
     
-    viral_tags = [t for t in tags if any(word in t for word in [
-        'booktok', 'trending', 'viral', 'must read', 'top books',
-        'bestseller'
-    ])]
-    
-    print(f"   🔥 Viral tags found: {len(viral_tags)}/44")
-    print(f"      {', '.join(viral_tags) if viral_tags else 'None'}")
+    emit(f"   🔥 Viral tags found: {len(viral_tags)}{denom}")
+    emit(f"      {', '.join(viral_tags) if viral_tags else 'None'}")
     
     viral_score = min(20, len(viral_tags) * 4)
-    print(f"\n   📈 Viral Potential Score: {viral_score}/20")
+    emit(f"\n   📈 Viral Potential Score: {viral_score}/20")
     
     # 6. AUDIENCE TARGETING
-    print("\n👥 6. AUDIENCE TARGETING")
-    print("-" * 80)
-    
-    audience_tags = [t for t in tags if any(word in t for word in [
-        'student', 'entrepreneur', 'reader', 'learner', 'professional',
-        'book lover'
-    ])]
+    emit("\n👥 6. AUDIENCE TARGETING")
+    emit("-" * 80)
     
-    print(f"   👥 Audience tags: {len(audience_tags)}/44")
-    print(f"      {', '.join(audience_tags) if audience_tags else 'None'}")
+    emit(f"   👥 Audience tags: {len(audience_tags)}{denom}")
+    emit(f"      {', '.join(audience_tags) if audience_tags else 'None'}")
     
     audience_score = min(20, len(audience_tags) * 3)
-    print(f"\n   📈 Audience Score: {audience_score}/20")
+    emit(f"\n   📈 Audience Score: {audience_score}/20")
     
     # 7. SEARCHABILITY
-    print("\n🔍 7. SEARCHABILITY (Natural Search Phrases)")
-    print("-" * 80)
-    
-    search_phrases = [t for t in tags if any(phrase in t for phrase in [
-        'how to', 'best', 'tips', 'guide', 'explained', 'learn',
-        'improve', 'better', 'change your'
-    ])]
+    emit("\n🔍 7. SEARCHABILITY (Natural Search Phrases)")
+    emit("-" * 80)
     
-    print(f"   🔍 Natural search phrases: {len(search_phrases)}/44")
-    print(f"      {', '.join(search_phrases) if search_phrases else 'None'}")
+    emit(f"   🔍 Natural search phrases: {len(search_phrases)}{denom}")
+    emit(f"      {', '.join(search_phrases) if search_phrases else 'None'}")
     
     search_score = min(30, len(search_phrases) * 4)
-    print(f"\n   📈 Searchability Score: {search_score}/30")
+    emit(f"\n   📈 Searchability Score: {search_score}/30")
     
     # FINAL SCORE CALCULATION
-    print("\n" + "=" * 80)
-    print("🎯 FINAL SEO SCORE")
-    print("=" * 80)
+    emit("\n" + "=" * 80)
+    emit("🎯 FINAL SEO SCORE")
+    emit("=" * 80)
     
     total_score = (
         volume_score +      # 50 points
@@ -199,15 +246,15 @@ def analyze_tags_seo(tags_string):
     max_score = 250
     percentage = (total_score / max_score) * 100
     
-    print(f"\n   Search Volume:     {volume_score}/50")
-    print(f"   Relevance:         {relevance_score}/50")
-    print(f"   Distribution:      {distribution_score}/50")
-    print(f"   Competition:       {comp_score}/30")
-    print(f"   Viral Potential:   {viral_score}/20")
-    print(f"   Audience:          {audience_score}/20")
-    print(f"   Searchability:     {search_score}/30")
-    print(f"   " + "-" * 40)
-    print(f"   TOTAL:             {total_score}/{max_score} ({percentage:.0f}%)")
+    emit(f"\n   Search Volume:     {volume_score}/50")
+    emit(f"   Relevance:         {relevance_score}/50")
+    emit(f"   Distribution:      {distribution_score}/50")
+    emit(f"   Competition:       {comp_score}/30")
+    emit(f"   Viral Potential:   {viral_score}/20")
+    emit(f"   Audience:          {audience_score}/20")
+    emit(f"   Searchability:     {search_score}/30")
+    emit(f"   " + "-" * 40)
+    emit(f"   TOTAL:             {total_score}/{max_score} ({percentage:.0f}%)")
     
     # GRADE
     if percentage >= 85:
@@ -221,12 +268,12 @@ def analyze_tags_seo(tags_string):
     else:
         grade = "D (Needs Improvement)"
     
-    print(f"\n   🏆 SEO GRADE: {grade}")
+    emit(f"\n   🏆 SEO GRADE: {grade}")
     
     # RECOMMENDATIONS
-    print("\n" + "=" * 80)
-    print("💡 SEO RECOMMENDATIONS")
-    print("=" * 80)
+    emit("\n" + "=" * 80)
+    emit("💡 SEO RECOMMENDATIONS")
+    emit("=" * 80)
     
     recommendations = []
     
@@ -249,9 +296,10 @@ def analyze_tags_seo(tags_string):
         recommendations.append("✅ Tag distribution is excellent! No major improvements needed.")
     
     for rec in recommendations:
-        print(f"   {rec}")
+        emit(f"   {rec}")
     
-    print("\n" + "=" * 80)
+    emit("\n" + "=" * 80)
+    sys.stdout.write("\n".join(out) + "\n")
 
 if __name__ == "__main__":
     # Test with IMPROVED prompt - First 40 tags only (simulating auto-trim)
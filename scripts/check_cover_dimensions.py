@@ -2,9 +2,9 @@
 # -*- coding: utf-8 -*-
 """فحص أبعاد أغلفة الكتب المجلوبة"""
 
-from PIL import Image
+from concurrent.futures import ThreadPoolExecutor
+from PIL import ImageFile
 import requests
-from io import BytesIO
 
 # URLs من آخر اختبار
 covers = [
@@ -23,13 +23,33 @@ headers = {
     "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/127.0.0.0 Safari/537.36"
 }
 
-for book_name, url in covers:
-    try:
-        response = requests.get(url, headers=headers, timeout=10)
+session = requests.Session()
+session.headers.update(headers)
+session.mount("https://", requests.adapters.HTTPAdapter(pool_maxsize=len(covers)))
+
+
+def fetch_size(url):
+    """قراءة أبعاد الغلاف (width, height) من رأس الصورة فقط"""
+    # الأبعاد موجودة في أول بضعة KB (SOFn في JPEG / IHDR في PNG):
+    # نقرأ على دفعات ونتوقف بمجرد أن يتعرف Pillow على الرأس
+    with session.get(url, timeout=10, stream=True) as response:
         response.raise_for_status()
-        
-        img = Image.open(BytesIO(response.content))
-        width, height = img.size
+        parser = ImageFile.Parser()
+        for chunk in response.iter_content(4096):
+            parser.feed(chunk)
+            if parser.image:
+                return parser.image.size
+    # الملف انتهى قبل التعرف على الرأس: close() يرفع الخطأ المناسب
+    return parser.close().size
+
+
+# كل الطلبات بالتوازي: الزمن الكلي ≈ أبطأ طلب بدل مجموع الطلبات
+with ThreadPoolExecutor(max_workers=len(covers)) as executor:
+    futures = [executor.submit(fetch_size, url) for _, url in covers]
+
+for (book_name, url), future in zip(covers, futures):
+    try:
+        width, height = future.result()
         aspect_ratio = width / height
         
         print(f"📖 {book_name}")
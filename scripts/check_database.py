@@ -1,13 +1,25 @@
 import json
+from collections import defaultdict
 from pathlib import Path
 
-db = json.loads(Path('src/database.json').read_text())
+try:
+    import orjson  # Optional: faster database.json parsing
+except ImportError:
+    orjson = None  # type: ignore
+
+# Both loaders accept bytes directly (no separate text decode step)
+loads = orjson.loads if orjson is not None else json.loads
+db = loads(Path('src/database.json').read_bytes())
 
 print('\n=== Database Status ===\n')
 
-done = [b for b in db['books'] if b.get('status') == 'done']
-processing = [b for b in db['books'] if b.get('status') == 'processing']
-uploaded = [b for b in db['books'] if b.get('status') == 'uploaded']
+# One pass: group titles by status
+by_status = defaultdict(list)
+for b in db['books']:
+    by_status[b.get('status')].append(b)
+done = by_status['done']
+processing = by_status['processing']
+uploaded = by_status['uploaded']
 
 print(f'✅ Done: {len(done)}')
 print(f'🔄 Processing: {len(processing)}')
@@ -2,11 +2,24 @@
 التحقق من صلاحية توكن YouTube وتجديده إذا لزم الأمر
 """
 import json
+import sys
 from pathlib import Path
-from datetime import datetime
+from datetime import datetime, timezone
 from google.oauth2.credentials import Credentials
 from google.auth.transport.requests import Request
 
+try:
+    import orjson  # Optional: faster token.json read/write
+except ImportError:
+    orjson = None  # type: ignore
+
+if sys.version_info >= (3, 11):
+    parse_expiry = datetime.fromisoformat  # Handles a trailing 'Z' natively
+else:
+    def parse_expiry(expiry_str):
+        """Parse an ISO expiry, mapping a trailing 'Z' to UTC (pre-3.11)"""
+        return datetime.fromisoformat(expiry_str.replace('Z', '+00:00'))
+
 def check_youtube_token():
     """التحقق من صلاحية توكن YouTube"""
     
@@ -19,8 +32,8 @@ def check_youtube_token():
     
     try:
         # قراءة التوكن
-        with open(token_path, 'r') as f:
-            token_data = json.load(f)
+        raw = token_path.read_bytes()
+        token_data = orjson.loads(raw) if orjson is not None else json.loads(raw)
         
         # عرض معلومات التوكن
         print("\n" + "="*60)
@@ -30,9 +43,8 @@ def check_youtube_token():
         expiry_str = token_data.get('expiry')
         if expiry_str:
             # Parse expiry time with timezone awareness
-            expiry = datetime.fromisoformat(expiry_str.replace('Z', '+00:00'))
+            expiry = parse_expiry(expiry_str)
             # Make 'now' timezone-aware to match expiry
-            from datetime import timezone
             now = datetime.now(timezone.utc)
             
             print(f"⏰ تاريخ الانتهاء: {expiry.strftime('%Y-%m-%d %H:%M:%S')}")
@@ -75,8 +87,11 @@ def check_youtube_token():
                             'expiry': creds.expiry.isoformat()
                         }
                         
-                        with open(token_path, 'w') as f:
-                            json.dump(new_token_data, f)
+                        if orjson is not None:
+                            token_path.write_bytes(orjson.dumps(new_token_data))
+                        else:
+                            with open(token_path, 'w') as f:
+                                json.dump(new_token_data, f)
                         
                         new_expiry = creds.expiry
                         new_remaining = new_expiry - now
@@ -111,8 +126,6 @@ def check_youtube_token():
 
 
 if __name__ == "__main__":
-    import sys
-    
     print("\n🔍 فحص صلاحية توكن YouTube...\n")
     
     is_valid = check_youtube_token()
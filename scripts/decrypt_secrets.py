@@ -11,16 +11,28 @@ Usage:
 The script will prompt for the password and decrypt all .enc files.
 """
 
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+import functools
 import getpass
 import argparse
 import os
+import shutil
 import sys
-from cryptography.fernet import Fernet, InvalidToken
+import threading
 from cryptography.hazmat.primitives import hashes
 from cryptography.hazmat.primitives.kdf.pbkdf2 import PBKDF2HMAC
 import base64
-import json
+
+# .enc format (scrypt marker + parameters) and cipher, shared with the
+# writer scripts. Files without SCRYPT_HEADER are legacy PBKDF2: salt
+# first, then the Fernet token.
+from encrypt_secrets import INVALID_TOKEN_ERRORS, SCRYPT_HEADER, derive_key_scrypt, make_fernet
+
+# Legacy PBKDF2 files store only the salt, not the iteration count, so this
+# value is part of their format and cannot be raised. New files use scrypt,
+# identified by SCRYPT_HEADER; stronger parameters get a new marker.
+PBKDF2_ITERATIONS = 100000
 
 
 def derive_key_from_password(password: str, salt: bytes) -> bytes:
@@ -38,12 +50,59 @@ def derive_key_from_password(password: str, salt: bytes) -> bytes:
         algorithm=hashes.SHA256(),
         length=32,
         salt=salt,
-        iterations=100000,  # Must match encryption iterations
+        iterations=PBKDF2_ITERATIONS,
     )
     key = base64.urlsafe_b64encode(kdf.derive(password.encode()))
     return key
 
 
+def read_salt_and_ciphertext(encrypted_path: Path):
+    """
+    Split an .enc file into its KDF, salt and Fernet token.
+    
+    Args:
+        encrypted_path: Path to encrypted .enc file
+        
+    Returns:
+        (derive_key, salt, encrypted_data) where derive_key is
+        derive_key_scrypt or derive_key_from_password
+    """
+    # Unbuffered: the header reads and the final readall() go straight to the
+    # OS, and readall() sizes the token buffer from fstat - one copy of the
+    # ciphertext, none through an intermediate 8 KiB read buffer
+    with open(encrypted_path, 'rb', buffering=0) as f:
+        header = f.read(len(SCRYPT_HEADER))
+        if header == SCRYPT_HEADER:
+            derive_key = derive_key_scrypt
+            salt = f.read(16)  # 16 bytes after the marker are the salt
+        else:
+            derive_key = derive_key_from_password
+            salt = header + f.read(16 - len(header))  # First 16 bytes are the salt
+        encrypted_data = f.read()  # Rest is encrypted content
+    return derive_key, salt, encrypted_data
+
+
+@functools.lru_cache(maxsize=16)
+def _cached_fernet(derive_key, password: str, salt: bytes):
+    return make_fernet(derive_key(password, salt))
+
+
+_KDF_LOCK = threading.Lock()
+
+
+def get_fernet(derive_key, password: str, salt: bytes):
+    """
+    Fernet for (KDF, password, salt), derived once and reused.
+    
+    encrypt_secrets.py and add_api_key.py write a whole batch with one salt,
+    so every file after the first hits the cache instead of re-running the KDF.
+    The lock keeps concurrent decrypts from all missing the cache at once and
+    deriving the same key in parallel.
+    """
+    with _KDF_LOCK:
+        return _cached_fernet(derive_key, password, salt)
+
+
 def decrypt_file(encrypted_path: Path, password: str) -> bytes:
     """
     Decrypt a file that was encrypted with password-based encryption.
@@ -56,19 +115,25 @@ def decrypt_file(encrypted_path: Path, password: str) -> bytes:
         Decrypted file contents
         
     Raises:
-        InvalidToken: If password is incorrect
+        INVALID_TOKEN_ERRORS: If password is incorrect
     """
-    with open(encrypted_path, 'rb') as f:
-        salt = f.read(16)  # First 16 bytes are the salt
-        encrypted_data = f.read()  # Rest is encrypted content
-    
-    key = derive_key_from_password(password, salt)
-    fernet = Fernet(key)
+    derive_key, salt, encrypted_data = read_salt_and_ciphertext(encrypted_path)
+    fernet = get_fernet(derive_key, password, salt)
     
     decrypted_data = fernet.decrypt(encrypted_data)
     return decrypted_data
 
 
+def restore_file(enc_file: Path, password: str, output_paths) -> None:
+    """Decrypt one .enc file and write it to every output path"""
+    first, *copies = output_paths
+    first.write_bytes(decrypt_file(enc_file, password))
+    # Extra locations (.env in the repo root) are copied from the first
+    # file (sendfile/CopyFile in the OS) rather than written again
+    for output_path in copies:
+        shutil.copyfile(first, output_path)
+
+
 def main():
     """Main decryption workflow."""
     parser = argparse.ArgumentParser(description="Decrypt secrets from secrets_encrypted/ to secrets/.")
@@ -90,8 +155,16 @@ def main():
         print("   2. The secrets_encrypted/ folder should be in the repo")
         sys.exit(1)
     
-    # Find encrypted files
-    encrypted_files = list(encrypted_dir.glob("*.enc"))
+    # Find encrypted files: one scandir pass, sizes come from the DirEntry
+    # (no separate glob match + stat() per file)
+    with os.scandir(encrypted_dir) as it:
+        file_sizes = {
+            Path(entry.path): entry.stat().st_size
+            for entry in it
+            if entry.name.endswith(".enc") and entry.is_file()
+        }
+    # Smallest first: it is the cheapest password check (see canary below)
+    encrypted_files = sorted(file_sizes, key=file_sizes.get)
     
     if not encrypted_files:
         print("❌ No encrypted files found!")
@@ -102,9 +175,8 @@ def main():
     print("=" * 50)
     print(f"\n📁 Found {len(encrypted_files)} encrypted file(s):")
     for enc_file in encrypted_files:
-        size = enc_file.stat().st_size
         original_name = enc_file.stem  # Remove .enc extension
-        print(f"   • {enc_file.name} → {original_name} ({size} bytes)")
+        print(f"   • {enc_file.name} → {original_name} ({file_sizes[enc_file]} bytes)")
     
     # Resolve password: CLI > file > env > prompt (unless non-interactive)
     password: str | None = None
@@ -136,6 +208,9 @@ def main():
     wrong_password_count = 0
     other_fail_count = 0
     
+    # Plan outputs per file, then decrypt concurrently (one derived key,
+    # independent files); results are reported in listing order
+    jobs = []
     for enc_file in encrypted_files:
         original_name = enc_file.stem  # Remove .enc extension
         
@@ -149,28 +224,40 @@ def main():
         else:
             # All other files go to secrets/ only
             output_paths = [secrets_dir / original_name]
+        jobs.append((enc_file, original_name, output_paths))
+    
+    skipped_count = 0
+    with ThreadPoolExecutor(max_workers=min(8, os.cpu_count() or 1, len(jobs))) as executor:
+        def submit(job):
+            enc_file, _, output_paths = job
+            return executor.submit(restore_file, enc_file, password, output_paths)
         
-        try:
-            # Decrypt file
-            decrypted_data = decrypt_file(enc_file, password)
-            
-            # Save decrypted file to all target locations
-            for output_path in output_paths:
-                with open(output_path, 'wb') as f:
-                    f.write(decrypted_data)
-                
+        # Canary: decrypt the smallest file alone first. A wrong password
+        # fails there, and the other files are skipped instead of each one
+        # failing the same way
+        futures = [submit(jobs[0])]
+        if isinstance(futures[0].exception(), INVALID_TOKEN_ERRORS):
+            skipped_count = len(jobs) - 1
+            jobs = jobs[:1]
+        else:
+            futures += [submit(job) for job in jobs[1:]]
+        
+        for (enc_file, original_name, _), future in zip(jobs, futures):
+            try:
+                future.result()
                 # Show only secrets/ path in output
-                if output_path.parent == secrets_dir:
-                    print(f"   ✅ {enc_file.name} → secrets/{original_name}")
-            
-            decrypted_count += 1
-            
-        except InvalidToken:
-            print(f"   ❌ {enc_file.name} - WRONG PASSWORD or corrupted file")
-            wrong_password_count += 1
-        except Exception as e:
-            print(f"   ❌ {enc_file.name} - Error: {e}")
-            other_fail_count += 1
+                print(f"   ✅ {enc_file.name} → secrets/{original_name}")
+                decrypted_count += 1
+                
+            except INVALID_TOKEN_ERRORS:
+                print(f"   ❌ {enc_file.name} - WRONG PASSWORD or corrupted file")
+                wrong_password_count += 1
+            except Exception as e:
+                print(f"   ❌ {enc_file.name} - Error: {e}")
+                other_fail_count += 1
+    
+    if skipped_count:
+        print(f"   ⏭️  Skipped {skipped_count} other file(s): password rejected by the first file")
     
     # Summary
     print(f"\n📊 Decryption Summary:")
@@ -12,17 +12,56 @@ The script will prompt for a password and encrypt all files in secrets/ to secre
 """
 
 from pathlib import Path
+from datetime import datetime
+import os
 import getpass
-from cryptography.fernet import Fernet
-from cryptography.hazmat.primitives import hashes
-from cryptography.hazmat.primitives.kdf.pbkdf2 import PBKDF2HMAC
+from cryptography.fernet import Fernet, InvalidToken
+try:
+    # Rust-backed drop-in with the same token format (optional, faster)
+    import rfernet  # type: ignore
+except ImportError:
+    rfernet = None
+from cryptography.hazmat.primitives.kdf.scrypt import Scrypt
 import base64
 import json
 
+try:
+    import orjson  # Optional: faster metadata writes
+except ImportError:
+    orjson = None  # type: ignore
 
-def derive_key_from_password(password: str, salt: bytes) -> bytes:
+# Written before the salt of files whose key was derived with scrypt.
+# Legacy PBKDF2 files start directly with the salt - decrypt_secrets.py reads both.
+# This marker and the scrypt parameters below are the on-disk format shared
+# with add_api_key.py, decrypt_secrets.py and reencrypt_all_secrets.py, which
+# all import them from here.
+SCRYPT_HEADER = b"YTTBscr1"
+
+# Wrong password / tampered token, from either Fernet backend
+# (rfernet raises DecryptionError, a TypeError subclass)
+if rfernet is not None:
+    INVALID_TOKEN_ERRORS = (InvalidToken, rfernet.DecryptionError)
+else:
+    INVALID_TOKEN_ERRORS = (InvalidToken,)
+
+# Files in secrets/ that are encrypted (also used by reencrypt_all_secrets.py --only-known)
+SECRET_FILES = (
+    "api_key.txt",
+    "api_keys.txt",  # Multiple API keys
+    "client_secret.json",
+    "cookies.txt",
+    "token.json",
+    ".env",  # Environment variables
+)
+
+
+def derive_key_scrypt(password: str, salt: bytes) -> bytes:
     """
-    Derive a Fernet encryption key from a password using PBKDF2.
+    Derive a Fernet encryption key from a password using scrypt.
+    Shared by every script that reads or writes .enc files.
+    
+    One OpenSSL call that is memory-hard, so it is both quicker and harder
+    to brute-force than 100k rounds of PBKDF2-SHA256.
     
     Args:
         password: User password
@@ -31,36 +70,94 @@ def derive_key_from_password(password: str, salt: bytes) -> bytes:
     Returns:
         32-byte encryption key suitable for Fernet
     """
-    kdf = PBKDF2HMAC(
-        algorithm=hashes.SHA256(),
-        length=32,
+    kdf = Scrypt(
         salt=salt,
-        iterations=100000,  # High iteration count for security
+        length=32,
+        n=2**14,  # 16 MiB with r=8 (changing these needs a new SCRYPT_HEADER)
+        r=8,
+        p=1,
     )
     key = base64.urlsafe_b64encode(kdf.derive(password.encode()))
     return key
 
 
-def encrypt_file(file_path: Path, password: str, salt: bytes) -> bytes:
+class _RFernetBytes:
+    """rfernet cipher with the bytes-in/bytes-out interface of cryptography's Fernet"""
+
+    def __init__(self, key: bytes):
+        self._fernet = rfernet.Fernet(key.decode())
+
+    def encrypt(self, data: bytes) -> bytes:
+        # rfernet returns the token as str
+        return self._fernet.encrypt(data).encode()
+
+    def decrypt(self, token: bytes) -> bytes:
+        # rfernet only accepts the token as str. latin-1 maps every byte, so
+        # a corrupted token still ends in DecryptionError, not UnicodeDecodeError
+        return self._fernet.decrypt(token.decode("latin-1"))
+
+
+def make_fernet(key: bytes):
+    """Build a Fernet cipher, preferring rfernet when installed"""
+    if rfernet is not None:
+        return _RFernetBytes(key)
+    return Fernet(key)
+
+
+def write_encrypted(file_path: Path, encrypted_path: Path, fernet, header: bytes) -> int:
     """
-    Encrypt a file's contents with password-based encryption.
+    Encrypt a file's contents into ``encrypted_path`` as header + Fernet token.
+    
+    Fernet tokens are produced in one piece (the HMAC covers the whole
+    ciphertext, and decrypt_secrets.py reads the token whole), so the
+    plaintext cannot be fed through in chunks. Instead the plaintext is
+    released as soon as the token exists.
+    
+    The token is complete before anything touches ``encrypted_path``: it is
+    written to a temp file next to it (created with mode 0o600, so a new
+    secrets file is never world-readable) and moved into place with
+    os.replace. A failure leaves the existing .enc file untouched. Header
+    and token go out in one vectored write where os.writev exists.
+    
+    The key is passed in already derived: a batch shares one salt, so
+    the KDF runs once per batch instead of once per file. Each token still
+    gets its own random IV from Fernet.
     
     Args:
         file_path: Path to file to encrypt
-        password: Encryption password
-        salt: Salt for key derivation
+        encrypted_path: Output .enc path (created or replaced)
+        fernet: Cipher from make_fernet(derive_key_scrypt(password, salt))
+        header: KDF marker + salt written before the token
         
     Returns:
-        Encrypted file contents
+        Number of bytes written
     """
-    key = derive_key_from_password(password, salt)
-    fernet = Fernet(key)
-    
-    with open(file_path, 'rb') as f:
-        data = f.read()
+    data = file_path.read_bytes()
+    token = fernet.encrypt(data)
+    del data
     
-    encrypted_data = fernet.encrypt(data)
-    return encrypted_data
+    tmp_path = encrypted_path.with_name(encrypted_path.name + ".tmp")
+    flags = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0)
+    fd = os.open(tmp_path, flags, 0o600)
+    try:
+        try:
+            total = len(header) + len(token)
+            if hasattr(os, "writev"):
+                written = os.writev(fd, [header, token])
+            else:
+                written = 0
+            if written < total:
+                # No writev (Windows) or a short write: finish with plain writes
+                rest = memoryview(header + token)[written:]
+                while rest:
+                    rest = rest[os.write(fd, rest):]
+        finally:
+            os.close(fd)
+        os.replace(tmp_path, encrypted_path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+    return total
 
 
 def main():
@@ -76,16 +173,13 @@ def main():
         return
     
     # Get list of files to encrypt
-    secret_files = [
-        "api_key.txt",
-        "api_keys.txt",  # Multiple API keys
-        "client_secret.json",
-        "cookies.txt",
-        "token.json",
-        ".env"  # Environment variables
-    ]
+    secret_files = SECRET_FILES
     
-    existing_files = [f for f in secret_files if (secrets_dir / f).exists()]
+    # One directory listing instead of a stat() per candidate file
+    present = {entry.name: entry for entry in os.scandir(secrets_dir) if entry.is_file()}
+    existing_files = [f for f in secret_files if f in present]
+    # Stat each found file once; size/mtime are reused from these results
+    file_stats = {f: present[f].stat() for f in existing_files}
     
     if not existing_files:
         print("❌ No secret files found to encrypt!")
@@ -97,8 +191,10 @@ def main():
     print("=" * 50)
     print(f"\n📁 Found {len(existing_files)} file(s) to encrypt:")
     for fname in existing_files:
-        size = (secrets_dir / fname).stat().st_size
-        print(f"   • {fname} ({size} bytes)")
+        st = file_stats[fname]
+        modified = datetime.fromtimestamp(st.st_mtime).strftime("%Y-%m-%d %H:%M")
+        warning = "  ⚠️  empty" if st.st_size == 0 else ""
+        print(f"   • {fname} ({st.st_size} bytes, modified {modified}){warning}")
     
     # Get password from user
     print("\n🔑 Enter encryption password:")
@@ -116,9 +212,11 @@ def main():
             return
     
     # Generate random salt (will be stored with encrypted files)
-    import os
     salt = os.urandom(16)
     
+    # Derive the key once for the whole batch (all files share the salt)
+    fernet = make_fernet(derive_key_scrypt(password, salt))
+    
     # Create encrypted directory
     encrypted_dir.mkdir(exist_ok=True)
     
@@ -131,13 +229,9 @@ def main():
         encrypted_path = encrypted_dir / f"{fname}.enc"
         
         try:
-            # Encrypt file
-            encrypted_data = encrypt_file(file_path, password, salt)
-            
-            # Save encrypted file with salt prepended
-            with open(encrypted_path, 'wb') as f:
-                f.write(salt)  # First 16 bytes are the salt
-                f.write(encrypted_data)  # Rest is encrypted content
+            # Save encrypted file: scrypt marker, then the 16-byte salt,
+            # then the encrypted content
+            write_encrypted(file_path, encrypted_path, fernet, SCRYPT_HEADER + salt)
             
             print(f"   ✅ {fname} → {encrypted_path.name}")
             encrypted_count += 1
@@ -150,14 +244,16 @@ def main():
         "encrypted_files": [f"{f}.enc" for f in existing_files],
         "original_files": existing_files,
         "encryption_method": "Fernet (AES-128)",
-        "kdf": "PBKDF2-SHA256",
-        "iterations": 100000,
-        "note": "First 16 bytes of each .enc file is the salt"
+        "kdf": "scrypt",
+        "scrypt_params": {"n": 2**14, "r": 8, "p": 1},
+        "note": "Each .enc file starts with the YTTBscr1 marker, then the 16-byte salt"
     }
     
     metadata_path = encrypted_dir / "encryption_metadata.json"
-    with open(metadata_path, 'w', encoding='utf-8') as f:
-        json.dump(metadata, f, indent=2)
+    if orjson is not None:
+        metadata_path.write_bytes(orjson.dumps(metadata, option=orjson.OPT_INDENT_2))
+    else:
+        metadata_path.write_text(json.dumps(metadata, indent=2), encoding='utf-8')
     
     print(f"\n✅ Encryption complete!")
     print(f"   📂 Encrypted files saved to: {encrypted_dir}")
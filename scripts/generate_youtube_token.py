@@ -12,27 +12,34 @@ import sys
 repo_root = Path(__file__).resolve().parent
 sys.path.insert(0, str(repo_root))
 
+# OAuth scopes and the static part of the installed-app client config, built
+# once at import (only client_id/client_secret come from the environment)
+SCOPES = [
+    "https://www.googleapis.com/auth/youtube.upload",
+    "https://www.googleapis.com/auth/youtube",
+]
+INSTALLED_APP_CONFIG = {
+    "redirect_uris": ["http://localhost", "http://127.0.0.1"],
+    "auth_uri": "https://accounts.google.com/o/oauth2/auth",
+    "token_uri": "https://oauth2.googleapis.com/token",
+    "project_id": "yt-upload-client",
+}
+
 def generate_token():
     """Generate YouTube OAuth token and save to secrets/token.json"""
     
     print("🔐 YouTube OAuth Token Generator")
     print("="*70)
     
-    # Import required modules
+    # Import required modules (deferred: google_auth_oauthlib pulls in
+    # oauthlib/requests_oauthlib, only needed once we actually authenticate)
     try:
         from google_auth_oauthlib.flow import InstalledAppFlow
-        from google.oauth2.credentials import Credentials
     except ImportError:
         print("❌ Missing required packages!")
         print("   Run: pip install google-auth-oauthlib google-auth google-api-python-client")
         return False
     
-    # Define scopes
-    SCOPES = [
-        "https://www.googleapis.com/auth/youtube.upload",
-        "https://www.googleapis.com/auth/youtube",
-    ]
-    
     # Locate client_secret.json
     secrets_dir = repo_root / "secrets"
     client_secret_file = secrets_dir / "client_secret.json"
@@ -58,10 +65,7 @@ def generate_token():
                 "installed": {
                     "client_id": client_id,
                     "client_secret": client_secret_env,
-                    "redirect_uris": ["http://localhost", "http://127.0.0.1"],
-                    "auth_uri": "https://accounts.google.com/o/oauth2/auth",
-                    "token_uri": "https://oauth2.googleapis.com/token",
-                    "project_id": "yt-upload-client",
+                    **INSTALLED_APP_CONFIG,
                 }
             }
             flow = InstalledAppFlow.from_client_config(client_config, SCOPES)
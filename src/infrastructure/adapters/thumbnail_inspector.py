@@ -10,7 +10,7 @@ contrast ratios, and visual quality metrics.
 from __future__ import annotations
 from pathlib import Path
 from typing import Optional, Dict, List, Tuple, Any
-from PIL import Image, ImageDraw, ImageFont
+from PIL import Image, ImageDraw, ImageFilter, ImageFont
 import json
 import colorsys
 
@@ -321,7 +321,6 @@ class ThumbnailInspector:
         W, H = self.img.size
         
         # Calculate sharpness (edge detection approximation)
-        from PIL import ImageFilter
         gray = self.img.convert('L')  # type: ignore
         edges = gray.filter(ImageFilter.EDGE_ENHANCE)
         edge_pixels = list(edges.getdata())
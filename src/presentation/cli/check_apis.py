@@ -3,7 +3,10 @@ Comprehensive API and Requirements Checker
 Tests all APIs and dependencies before pipeline execution
 """
 
+import functools
+import importlib.metadata
 import os
+import shutil
 import sys
 from pathlib import Path
 from typing import Dict, List, Tuple
@@ -224,12 +227,22 @@ def check_google_books_api() -> Tuple[bool, str]:
         return True, f"⚠️ Google Books check failed (fallback available): {str(e)[:50]}"
 
 
+@functools.lru_cache(maxsize=None)
+def _resolve_cmd(cmd: str):
+    """Resolve an executable on PATH once per process (None if missing)"""
+    return shutil.which(cmd) or shutil.which(cmd + ".exe")
+
+
 def check_ffmpeg() -> Tuple[bool, str]:
     """Check if FFmpeg is installed and accessible"""
+    ffmpeg = _resolve_cmd("ffmpeg")
+    if ffmpeg is None:
+        return False, "❌ FFmpeg not found in PATH"
+
     try:
         import subprocess
         result = subprocess.run(
-            ["ffmpeg", "-version"],
+            [ffmpeg, "-version"],
             capture_output=True,
             text=True,
             timeout=5
@@ -272,30 +285,32 @@ def check_playwright() -> Tuple[bool, str]:
 
 def check_python_packages() -> Tuple[bool, str]:
     """Check if all required Python packages are installed"""
-    package_imports = {
-        "google-generativeai": "google.generativeai",
-        "requests": "requests",
-        "playwright": "playwright",
-        "pillow": "PIL",
-        "edge-tts": "edge_tts",
-        "yt-dlp": "yt_dlp",
-        "rich": "rich",
-        "typer": "typer",
-        "python-dotenv": "dotenv",
-        "mutagen": "mutagen"
-    }
+    # Distribution names - checked via installed metadata, without importing
+    # the packages themselves (google.generativeai, playwright, PIL are slow)
+    packages = [
+        "google-generativeai",
+        "requests",
+        "playwright",
+        "pillow",
+        "edge-tts",
+        "yt-dlp",
+        "rich",
+        "typer",
+        "python-dotenv",
+        "mutagen"
+    ]
 
     missing = []
-    for package_name, import_name in package_imports.items():
+    for package_name in packages:
         try:
-            __import__(import_name)
-        except ImportError:
+            importlib.metadata.version(package_name)
+        except importlib.metadata.PackageNotFoundError:
             missing.append(package_name)
 
     if missing:
         return False, f"❌ Missing packages: {', '.join(missing)}"
     else:
-        return True, f"✅ All {len(package_imports)} required packages installed"
+        return True, f"✅ All {len(packages)} required packages installed"
 
 
 def check_fonts() -> Tuple[bool, str]:
@@ -351,11 +366,8 @@ def check_secrets_env() -> Tuple[bool, str]:
     load_dotenv(env_path)
 
     required_keys = ["GEMINI_API_KEY", "PEXELS_API_KEY", "YT_API_KEY"]
-    missing_keys = []
-
-    for key in required_keys:
-        if not os.getenv(key):
-            missing_keys.append(key)
+    getenv = os.environ.get  # bound once for the loop
+    missing_keys = [key for key in required_keys if not getenv(key)]
 
     if missing_keys:
         return False, f"❌ Missing keys in .env: {', '.join(missing_keys)}"
@@ -14,6 +14,11 @@ import sys
 import re
 import tempfile
 
+try:
+    import orjson  # Optional: faster summary.json writes
+except ImportError:
+    orjson = None  # type: ignore
+
 # Add repo root to sys.path BEFORE imports
 repo_root = Path(__file__).resolve().parents[3]  # Go up to project root (contains src/)
 if str(repo_root) not in sys.path:
@@ -129,8 +134,10 @@ def _save_summary(run_dir: Path, summary: dict) -> None:
     """
     try:
         summary_path = run_dir / "summary.json"
-        with summary_path.open("w", encoding="utf-8") as f:
-            json.dump(summary, f, ensure_ascii=False, indent=2)
+        if orjson is not None:
+            summary_path.write_bytes(orjson.dumps(summary, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
+        else:
+            summary_path.write_text(json.dumps(summary, ensure_ascii=False, indent=2), encoding="utf-8")
     except Exception as e:
         # Log but don't fail pipeline if summary save fails
         print(f"[warning] Could not save summary.json: {e}")